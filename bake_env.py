@@ -0,0 +1,79 @@
+"""
+Bake the .env file into an importable Python module.
+
+config.py normally parses .env with python-dotenv every time the tracker
+starts. This script does that parsing once and writes the values to
+_env_baked.py as plain string literals, which config.py imports instead
+(see the "Baked Environment" section in config.py).
+
+The generated file contains your credentials. It is listed in .gitignore
+and must not be committed.
+
+Example:
+    Bake the current .env:
+    >>> python bake_env.py
+    
+    Bake a different file:
+    >>> python bake_env.py --env-file /path/to/.env
+"""
+import os
+import argparse
+from dotenv import dotenv_values
+
+BAKED_MODULE = "_env_baked.py"
+"""Name of the generated module, next to config.py."""
+
+
+def bake_env(env_path, output_path):
+    """
+    Write the variables from a .env file to a Python module.
+    
+    Args:
+        env_path (str): Path to the .env file to read
+        output_path (str): Path of the Python module to write
+    
+    Returns:
+        int: Number of variables written.
+    
+    Note:
+        - Variables without a value or with names that are not valid Python
+          identifiers are skipped
+        - Values are written as strings; config.py converts them as needed
+    """
+    values = dotenv_values(env_path)
+    
+    lines = [
+        '"""Generated by bake_env.py from .env - do not edit or commit."""',
+    ]
+    count = 0
+    for name, value in values.items():
+        if value is None or not name.isidentifier():
+            continue
+        lines.append(f"{name} = {value!r}")
+        count += 1
+    
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return count
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    parser = argparse.ArgumentParser(
+        description="Bake .env into _env_baked.py so config.py can skip parsing it"
+    )
+    parser.add_argument(
+        "--env-file",
+        default=os.path.join(base_dir, ".env"),
+        help="Path to the .env file to bake (default: .env next to this script)"
+    )
+    args = parser.parse_args()
+    
+    if not os.path.isfile(args.env_file):
+        print(f"✗ {args.env_file} not found")
+        exit(1)
+    
+    output_path = os.path.join(base_dir, BAKED_MODULE)
+    count = bake_env(args.env_file, output_path)
+    print(f"✓ Baked {count} variable(s) into {output_path}")
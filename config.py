@@ -14,17 +14,62 @@ Environment Variables:
     - EMAIL_PASSWORD: Email password or app password
     - EMAIL_TO: Recipient email address
 
+    Set DOTENV_SKIP=1 to ignore the .env file and use only variables that
+    are already exported (e.g. by systemd or docker).
+
+    Set DEBUG_SCRAPER=1 for detailed (DEBUG level) scraper output and to
+    save the page source when scraping fails.
+
+Baked Environment:
+    Instead of parsing .env on every start, the values can be baked into a
+    Python module once with ``python bake_env.py``. If the generated
+    _env_baked.py exists it is imported instead of loading .env. Variables
+    set in the real environment still take precedence over baked values.
+    Re-run the script after editing .env.
+
 Usage:
     Import this module to access configuration:
     >>> import config
-    >>> max_rent = config.SEARCH_CRITERIA["kaltmiete_max"]
+    >>> max_rent = config.SEARCH_CRITERIA.kaltmiete_max
     >>> interval = config.SCRAPE_INTERVAL_MINUTES
 """
 import os
-from dotenv import load_dotenv
+import tempfile
+from typing import NamedTuple
+
+_DOTENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+# Prefer values baked by bake_env.py; only parse .env if they don't exist.
+# Skip dotenv entirely if there is no .env file or DOTENV_SKIP=1 is set
+# (e.g. under systemd/docker, where the variables are already exported).
+try:
+    import _env_baked
+except ImportError:
+    _env_baked = None
+    if os.path.isfile(_DOTENV_PATH) and os.environ.get("DOTENV_SKIP") != "1":
+        from dotenv import load_dotenv
+        
+        # Load environment variables from .env file
+        load_dotenv(_DOTENV_PATH)
+
+
+def _env(name, default=None):
+    """
+    Look up a setting from the environment or the baked .env values.
+    
+    Args:
+        name (str): Variable name (e.g., "EMAIL_USERNAME")
+        default (str, optional): Value to use if the variable is not set.
+            Defaults to None.
+    
+    Returns:
+        str: The variable's value, or ``default`` if it is not set.
+    """
+    value = os.environ.get(name)
+    if value is None and _env_baked is not None:
+        value = getattr(_env_baked, name, None)
+    return default if value is None else value
 
-# Load environment variables from .env file
-load_dotenv()
 
 # ============================================================================
 # SEARCH CRITERIA
@@ -32,12 +77,20 @@ load_dotenv()
 # These criteria are used to filter apartment listings on the website.
 # The scraper will only extract listings that match ALL of these criteria.
 
-SEARCH_CRITERIA = {
-    "kaltmiete_max": 440,  # Maximum cold rent in EUR (excludes utilities)
-    "zimmer_min": 1,       # Minimum number of rooms
-    "zimmer_max": 2,       # Maximum number of rooms
-    "wohnflaeche_max": 50  # Maximum living area in square meters
-}
+class SearchCriteria(NamedTuple):
+    """Search filter values, accessed as attributes (e.g. .kaltmiete_max)."""
+    kaltmiete_max: int    # Maximum cold rent in EUR (excludes utilities)
+    zimmer_min: int       # Minimum number of rooms
+    zimmer_max: int       # Maximum number of rooms
+    wohnflaeche_max: int  # Maximum living area in square meters
+
+
+SEARCH_CRITERIA = SearchCriteria(
+    kaltmiete_max=440,
+    zimmer_min=1,
+    zimmer_max=2,
+    wohnflaeche_max=50
+)
 
 # ============================================================================
 # WEBSITE CONFIGURATION
@@ -69,6 +122,15 @@ HEADLESS_BROWSER = True
 """Whether to run browser in headless mode (no visible window).
 Set to False to see the browser window (useful for debugging)."""
 
+DEBUG_SCRAPER = "1" in (_env("DEBUG_SCRAPER"), _env("TRACKAPT_DEBUG"))
+"""Whether to log per-step and per-listing details (DEBUG level) and save the
+page source (debug_*_<timestamp>.html) when extraction or form submission
+fails. Enable with DEBUG_SCRAPER=1 (TRACKAPT_DEBUG is accepted as well)."""
+
+CHROME_PROFILE_DIR = os.path.join(tempfile.gettempdir(), "trackapt-profile")
+"""Chrome profile directory reused between browser starts. Keeps cookies
+(e.g. the accepted privacy banner) so they don't have to be set again."""
+
 # ============================================================================
 # QUIET HOURS
 # ============================================================================
@@ -96,7 +158,7 @@ DATABASE_PATH = "apartments.db"
 # NOTIFICATION SETTINGS
 # ============================================================================
 
-NOTIFICATION_METHOD = os.getenv("NOTIFICATION_METHOD", "email")
+NOTIFICATION_METHOD = _env("NOTIFICATION_METHOD", "email")
 """Notification method: 'email' or 'ntfy'. Defaults to 'email'."""
 
 # ============================================================================
@@ -105,7 +167,7 @@ NOTIFICATION_METHOD = os.getenv("NOTIFICATION_METHOD", "email")
 # Configure these if using ntfy.sh for push notifications.
 # See https://ntfy.sh for more information.
 
-NTFY_TOPIC = os.getenv("NTFY_TOPIC", "")
+NTFY_TOPIC = _env("NTFY_TOPIC", "")
 """NTFY topic name for push notifications. Leave empty if not using ntfy."""
 
 # ============================================================================
@@ -114,19 +176,19 @@ NTFY_TOPIC = os.getenv("NTFY_TOPIC", "")
 # These are loaded from environment variables (.env file) for security.
 # See .env.example for the required format.
 
-EMAIL_SMTP_SERVER = os.getenv("EMAIL_SMTP_SERVER")
+EMAIL_SMTP_SERVER = _env("EMAIL_SMTP_SERVER")
 """SMTP server address (e.g., smtp.gmail.com)."""
 
-EMAIL_SMTP_PORT = int(os.getenv("EMAIL_SMTP_PORT", "587"))
+EMAIL_SMTP_PORT = int(_env("EMAIL_SMTP_PORT", "587"))
 """SMTP server port. Defaults to 587 (TLS)."""
 
-EMAIL_USERNAME = os.getenv("EMAIL_USERNAME")
+EMAIL_USERNAME = _env("EMAIL_USERNAME")
 """Email address for sending notifications."""
 
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+EMAIL_PASSWORD = _env("EMAIL_PASSWORD")
 """Email password or app password. For Gmail, use an App Password."""
 
-EMAIL_TO = os.getenv("EMAIL_TO")
+EMAIL_TO = _env("EMAIL_TO")
 """Recipient email address for notifications."""
 
 
@@ -26,12 +26,68 @@ Example:
     >>> python main.py --test-email
 """
 import time
+import sched
 import random
+import signal
 import argparse
-from datetime import datetime
-from scraper import scrape_apartments, init_database, send_test_email
+import threading
+from datetime import datetime, timedelta
+from scraper import scrape_apartments, init_database, send_test_email, configure_logging
 import config
 
+# Interval jitter is drawn as base + random() * span - offset, i.e. uniformly
+# from [base - offset, base + offset]. The constants are derived once here.
+_rand = random.random
+_NORMAL_BASE = config.SCRAPE_INTERVAL_MINUTES
+_NORMAL_OFFSET = config.SCRAPE_INTERVAL_RANDOM_MINUTES
+_NORMAL_SPAN = 2 * _NORMAL_OFFSET
+_NEW_BASE = config.SCRAPE_INTERVAL_NEW_LISTINGS_MINUTES
+_NEW_OFFSET = config.SCRAPE_INTERVAL_NEW_LISTINGS_RANDOM_MINUTES
+_NEW_SPAN = 2 * _NEW_OFFSET
+
+QUIET_HOURS_RESUME_BUFFER = timedelta(minutes=5)
+"""Extra wait after quiet hours end before the first scrape resumes."""
+
+_stop_event = threading.Event()
+"""Set by the SIGINT handler to ask the scheduler loop to stop."""
+
+
+def _request_stop(signum, frame):
+    """
+    SIGINT handler that asks the scheduler to stop after the current step.
+    
+    Waits in the scheduler return immediately once the stop event is set. A
+    scrape that is already running is allowed to finish. The default handler
+    is restored, so pressing Ctrl+C a second time aborts right away.
+    """
+    print("\n\n👋 Stop requested, finishing current step (press Ctrl+C again to abort)...")
+    _stop_event.set()
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+
+def _wait_or_stop(seconds):
+    """
+    Delay function for the scheduler: wait, but return early on stop.
+    
+    If a stop was requested, all pending scrapes are cancelled so that
+    _scheduler.run() returns instead of waiting again.
+    """
+    if _stop_event.wait(max(0, seconds)):
+        _cancel_pending_scrapes()
+
+
+def _cancel_pending_scrapes():
+    """Remove all scheduled scrapes from the scheduler queue."""
+    for event in _scheduler.queue:
+        try:
+            _scheduler.cancel(event)
+        except ValueError:
+            pass  # Already ran or removed
+
+
+_scheduler = sched.scheduler(time.time, _wait_or_stop)
+"""Event scheduler driving the scrapes; waits via _wait_or_stop."""
+
 
 def is_quiet_hours():
     """
@@ -58,8 +114,7 @@ def is_quiet_hours():
     if not config.QUIET_HOURS_ENABLED:
         return False
     
-    now = datetime.now()
-    current_hour = now.hour
+    current_hour = time.localtime().tm_hour
     
     start_hour = config.QUIET_HOURS_START
     end_hour = config.QUIET_HOURS_END
@@ -71,6 +126,56 @@ def is_quiet_hours():
         return start_hour <= current_hour < end_hour
 
 
+def get_quiet_hours_resume_time(now=None):
+    """
+    Calculate when scraping should resume after the current quiet hours.
+    
+    The resume time is the next occurrence of QUIET_HOURS_END (on the hour)
+    after ``now``, plus a small buffer. Because it is an absolute timestamp,
+    it only needs to be computed once when quiet hours are entered; callers
+    can then sleep until it instead of re-checking every minute.
+    
+    Args:
+        now (datetime, optional): Reference time. Defaults to datetime.now().
+    
+    Returns:
+        datetime: Point in time at which scraping should resume.
+    
+    Examples:
+        If QUIET_HOURS_END=8:
+        - 22:30 -> 08:05 the next day
+        - 03:10 -> 08:05 the same day
+    """
+    if now is None:
+        now = datetime.now()
+    
+    resume_at = now.replace(hour=config.QUIET_HOURS_END, minute=0, second=0, microsecond=0)
+    if resume_at <= now:
+        # End hour already passed today, so quiet hours end tomorrow
+        resume_at += timedelta(days=1)
+    return resume_at + QUIET_HOURS_RESUME_BUFFER
+
+
+def get_next_quiet_start(now=None):
+    """
+    Calculate when the next quiet hours period starts.
+    
+    Args:
+        now (datetime, optional): Reference time. Defaults to datetime.now().
+    
+    Returns:
+        datetime: Next occurrence of QUIET_HOURS_START (on the hour) after
+            ``now``.
+    """
+    if now is None:
+        now = datetime.now()
+    
+    start_at = now.replace(hour=config.QUIET_HOURS_START, minute=0, second=0, microsecond=0)
+    if start_at <= now:
+        start_at += timedelta(days=1)
+    return start_at
+
+
 def get_next_interval(new_listings_found=False):
     """
     Calculate the next scraping interval with random variation.
@@ -101,20 +206,12 @@ def get_next_interval(new_listings_found=False):
     """
     if new_listings_found:
         # Shorter interval when new listings found
-        base = config.SCRAPE_INTERVAL_NEW_LISTINGS_MINUTES
-        random_variation = random.uniform(
-            -config.SCRAPE_INTERVAL_NEW_LISTINGS_RANDOM_MINUTES,
-            config.SCRAPE_INTERVAL_NEW_LISTINGS_RANDOM_MINUTES
-        )
+        interval = _NEW_BASE + _rand() * _NEW_SPAN - _NEW_OFFSET
     else:
         # Normal interval
-        base = config.SCRAPE_INTERVAL_MINUTES
-        random_variation = random.uniform(
-            -config.SCRAPE_INTERVAL_RANDOM_MINUTES,
-            config.SCRAPE_INTERVAL_RANDOM_MINUTES
-        )
+        interval = _NORMAL_BASE + _rand() * _NORMAL_SPAN - _NORMAL_OFFSET
     
-    interval = max(1, base + random_variation)  # Ensure at least 1 minute
+    interval = max(1, interval)  # Ensure at least 1 minute
     return interval
 
 
@@ -148,30 +245,10 @@ def run_scraper_with_scheduling():
         print(f"⏸️  Quiet hours active ({now.strftime('%H:%M')}). Skipping scrape.")
         
         # Calculate time until quiet hours end
-        end_hour = config.QUIET_HOURS_END
-        current_hour = now.hour
-        current_minute = now.minute
-        
-        if config.QUIET_HOURS_START > end_hour:  # Spans midnight
-            if current_hour >= config.QUIET_HOURS_START:
-                # We're in the evening/night part (e.g., 21:00-23:59)
-                # Wait until next day's end_hour
-                hours_until_end = (24 - current_hour) + end_hour
-            else:
-                # We're in the morning part (e.g., 00:00-06:59)
-                # Wait until end_hour today
-                hours_until_end = end_hour - current_hour
-        else:
-            # Quiet hours don't span midnight
-            if current_hour < end_hour:
-                hours_until_end = end_hour - current_hour
-            else:
-                hours_until_end = (24 - current_hour) + end_hour
-        
-        # Subtract current minutes and add some buffer
-        minutes_until_end = (hours_until_end * 60) - current_minute + 5
+        resume_at = get_quiet_hours_resume_time(now)
+        minutes_until_end = (resume_at - now).total_seconds() / 60
         next_interval = max(1, minutes_until_end)  # At least 1 minute
-        print(f"   Next scrape in {next_interval:.0f} minutes (at {end_hour:02d}:00)")
+        print(f"   Next scrape in {next_interval:.0f} minutes (at {resume_at.strftime('%H:%M')})")
         return next_interval
     
     # Run scraper
@@ -189,25 +266,46 @@ def run_scraper_with_scheduling():
     return next_interval
 
 
+def _scheduled_scrape():
+    """
+    Run one scrape and schedule the next one.
+    
+    The next scrape is scheduled after the interval returned by
+    run_scraper_with_scheduling(), or at the start of quiet hours if that
+    comes first. At that point run_scraper_with_scheduling() skips the
+    scrape and returns the time until quiet hours end, so the scheduler
+    wakes up exactly twice per quiet-hours period.
+    """
+    next_interval = run_scraper_with_scheduling()
+    if _stop_event.is_set():
+        return
+    
+    now = datetime.now()
+    run_at = now + timedelta(minutes=next_interval)
+    if config.QUIET_HOURS_ENABLED:
+        run_at = min(run_at, get_next_quiet_start(now))
+    
+    print(f"\n⏳ Waiting {(run_at - now).total_seconds() / 60:.1f} minutes until next scrape...\n")
+    _scheduler.enterabs(run_at.timestamp(), 1, _scheduled_scrape)
+
+
 def run_scheduler():
     """
     Main scheduler loop that runs the scraper continuously.
     
     This function:
     1. Initializes and prints configuration
-    2. Runs scraper immediately on start
-    3. Enters infinite loop that:
-       - Waits for calculated interval
-       - Checks for quiet hours during wait
-       - Runs scraper and gets next interval
-       - Repeats
+    2. Schedules a scrape to run immediately
+    3. Runs a sched.scheduler event loop in which every scrape schedules the
+       next one (see _scheduled_scrape), either after the calculated
+       interval or at the start of quiet hours, whichever comes first
     
-    The scheduler sleeps in 1-minute chunks to allow for:
-    - Keyboard interrupt (Ctrl+C) to stop gracefully
-    - Detection of quiet hours during long waits
-    - More responsive behavior
+    Each wait is a single blocking wait on a stop event. Ctrl+C sets the
+    stop event through a SIGINT handler, which ends the wait immediately and
+    cancels pending scrapes, so no polling is needed to stay responsive.
     
-    The function handles KeyboardInterrupt gracefully, allowing clean shutdown.
+    The first Ctrl+C stops gracefully (a running scrape is allowed to
+    finish); a second Ctrl+C raises KeyboardInterrupt, which is also handled.
     
     Side Effects:
         - Prints startup configuration
@@ -240,40 +338,20 @@ def run_scheduler():
     print(f"💾 Database: {config.DATABASE_PATH}")
     print("\nPress Ctrl+C to stop\n")
     
-    # Run immediately on start
-    next_interval = run_scraper_with_scheduling()
+    _stop_event.clear()
+    signal.signal(signal.SIGINT, _request_stop)
     
     # Keep running with dynamic scheduling
     try:
-        while True:
-            # Wait for the calculated interval
-            wait_seconds = next_interval * 60
-            print(f"\n⏳ Waiting {next_interval:.1f} minutes until next scrape...\n")
-            
-            # Sleep in smaller chunks to allow for interruption
-            sleep_chunk = 60  # Check every minute
-            chunks = int(wait_seconds / sleep_chunk)
-            remainder = wait_seconds % sleep_chunk
-            
-            for _ in range(chunks):
-                time.sleep(sleep_chunk)
-                # Check if we've entered quiet hours during wait
-                if is_quiet_hours():
-                    print(f"⏸️  Entered quiet hours. Pausing until {config.QUIET_HOURS_END:02d}:00")
-                    # Wait until quiet hours end
-                    while is_quiet_hours():
-                        time.sleep(60)  # Check every minute
-                    print("✅ Quiet hours ended. Resuming...")
-                    break
-            
-            if remainder > 0:
-                time.sleep(remainder)
-            
-            # Run scraper and get next interval
-            next_interval = run_scraper_with_scheduling()
-            
+        # Run immediately on start; each scrape schedules the next one
+        _scheduler.enter(0, 1, _scheduled_scrape)
+        _scheduler.run()
+        print("\n👋 Stopping apartment tracker...")
     except KeyboardInterrupt:
+        _cancel_pending_scrapes()
         print("\n\n👋 Stopping apartment tracker...")
+    finally:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
 
 
 if __name__ == "__main__":
@@ -294,6 +372,7 @@ Examples:
     
     args = parser.parse_args()
     
+    configure_logging()
     init_database()
     
     if args.test_email:
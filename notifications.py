@@ -11,6 +11,9 @@ The module automatically sends system notifications (macOS) for all new listings
 and additionally sends via the configured method (email or ntfy) based on
 settings in config.py.
 
+Several listings found in the same scrape can be combined into a single
+email or ntfy message with send_notification_batch().
+
 Example:
     >>> from notifications import send_notification
     >>> send_notification(
@@ -19,14 +22,140 @@ Example:
     ...     image_url="https://example.com/image.jpg"
     ... )
 """
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import requests
-import subprocess
-import platform
+import atexit
+import sys
+import threading
 import config
 
+# Heavy dependencies (smtplib, email, requests, subprocess) are imported
+# inside the functions that use them. Only one notification method is used
+# per run, so there is no need to pay for all of them at startup.
+
+_IS_MAC = sys.platform == "darwin"
+"""Whether we run on macOS, where system notifications are supported."""
+
+# AppleScript templates for system notifications; values are escaped with
+# _APPLESCRIPT_ESCAPE in a single str.translate pass before formatting
+_APPLESCRIPT_ESCAPE = str.maketrans({'"': '\\"', '\n': ' '})
+_APPLESCRIPT_SOUND = 'display notification "{message}" with title "{title}" sound name "Glass"'
+_APPLESCRIPT_SILENT = 'display notification "{message}" with title "{title}"'
+
+# Optional: with pyobjc installed, notifications are posted in-process
+# instead of spawning an osascript process for each one. Outside an app
+# bundle (e.g. a plain venv python) there is no default notification
+# center; osascript is used then.
+NSUserNotification = _notification_center = None
+if _IS_MAC:
+    try:
+        from Foundation import NSUserNotification, NSUserNotificationCenter
+        _notification_center = NSUserNotificationCenter.defaultUserNotificationCenter()
+    except ImportError:
+        pass
+
+# Email settings captured once; they don't change while running
+_SMTP_ADDRESS = (config.EMAIL_SMTP_SERVER, config.EMAIL_SMTP_PORT)
+_SMTP_CREDENTIALS = (config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
+_EMAIL_TO = config.EMAIL_TO
+
+# Whether each method is configured; checked first so a misconfigured
+# method returns before any message is built
+_EMAIL_READY = bool(config.EMAIL_USERNAME and config.EMAIL_PASSWORD and config.EMAIL_TO)
+_NTFY_READY = bool(config.NTFY_TOPIC)
+_NTFY_URL = f"https://ntfy.sh/{config.NTFY_TOPIC}" if _NTFY_READY else None
+
+_smtp_conn = None
+"""Logged-in SMTP connection kept open between notifications (see _get_smtp)."""
+
+_smtp_lock = threading.Lock()
+"""Guards _smtp_conn; emails may be sent from a worker thread."""
+
+
+def _get_smtp():
+    """
+    Return a logged-in SMTP connection, reusing the open one if still alive.
+    
+    Opening a connection costs a TCP connect, STARTTLS handshake and login,
+    which dominates the time to send a single notification. The connection
+    is therefore kept open and checked with a NOOP before reuse; if the
+    server has dropped it in the meantime, a new one is opened.
+    
+    Note:
+        The caller must hold _smtp_lock until it is done with the connection.
+    
+    Returns:
+        smtplib.SMTP: Connected and authenticated SMTP client.
+    
+    Raises:
+        smtplib.SMTPException, OSError: If a new connection cannot be opened.
+    """
+    import smtplib
+    global _smtp_conn
+    
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.noop()
+            return _smtp_conn
+        except (smtplib.SMTPException, OSError):
+            _close_smtp()
+    
+    server = smtplib.SMTP(*_SMTP_ADDRESS)
+    server.starttls()
+    server.login(*_SMTP_CREDENTIALS)
+    _smtp_conn = server
+    return server
+
+
+def _close_smtp():
+    """
+    Close the shared SMTP connection, if one is open.
+    
+    Registered with atexit so the connection is shut down cleanly when the
+    tracker stops. Errors are ignored since the connection may already be
+    gone.
+    
+    Note:
+        Other callers must hold _smtp_lock. At exit no email is being sent
+        (scrape_apartments waits for its send), so no lock is taken there.
+    """
+    global _smtp_conn
+    
+    if _smtp_conn is None:
+        return
+    
+    import smtplib
+    try:
+        _smtp_conn.quit()
+    except (smtplib.SMTPException, OSError):
+        _smtp_conn.close()
+    _smtp_conn = None
+
+
+atexit.register(_close_smtp)
+
+_ntfy_session = None
+"""HTTP session reused for ntfy.sh so keep-alive skips the TCP/TLS setup."""
+
+
+def _get_ntfy_session():
+    """
+    Return the shared requests session for ntfy.sh, creating it on first use.
+    
+    Returns:
+        requests.Session: Session with a small keep-alive connection pool.
+    """
+    global _ntfy_session
+    
+    if _ntfy_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        session.headers["User-Agent"] = "trackappartments"
+        session.headers["Priority"] = "high"  # Same for every ntfy notification
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        _ntfy_session = session
+    return _ntfy_session
+
 
 def send_email_notification(message, subject="New Apartment Listing", html_message=None, image_url=None):
     """
@@ -53,32 +182,52 @@ def send_email_notification(message, subject="New Apartment Listing", html_messa
         - Requires EMAIL_USERNAME, EMAIL_PASSWORD, EMAIL_TO, EMAIL_SMTP_SERVER,
           and EMAIL_SMTP_PORT to be set in .env file
         - Uses STARTTLS for secure connection
+        - Keeps the SMTP connection open for subsequent notifications
         - Prints error messages but doesn't raise exceptions
     """
-    if not config.EMAIL_USERNAME or not config.EMAIL_PASSWORD or not config.EMAIL_TO:
+    if not _EMAIL_READY:
         print("⚠ Email credentials not configured")
         return False
     
+    username, recipient = _SMTP_CREDENTIALS[0], _EMAIL_TO
+    
+    import smtplib
+    from email import policy
+    from email.message import EmailMessage
+    from email.utils import getaddresses, parseaddr
+    
     try:
-        msg = MIMEMultipart('alternative')
-        msg['From'] = config.EMAIL_USERNAME
-        msg['To'] = config.EMAIL_TO
+        # SMTP policy (CRLF line endings) restricted to 7bit-safe encodings,
+        # since sendmail() passes the bytes through unchanged
+        msg = EmailMessage(policy=policy.SMTP.clone(cte_type='7bit'))
+        msg['From'] = username
+        msg['To'] = recipient
         msg['Subject'] = subject
         
         # Add plain text version
-        msg.attach(MIMEText(message, 'plain'))
+        msg.set_content(message)
         
-        # Add HTML version if provided
+        # Add HTML version if provided (turns the message into
+        # multipart/alternative)
         # Note: We use image URLs directly in HTML instead of attaching images
         # This is more compatible with email clients like Apple Mail
         if html_message:
-            msg.attach(MIMEText(html_message, 'html'))
+            msg.add_alternative(html_message, subtype='html')
         
-        server = smtplib.SMTP(config.EMAIL_SMTP_SERVER, config.EMAIL_SMTP_PORT)
-        server.starttls()
-        server.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
-        server.send_message(msg)
-        server.quit()
+        # Flatten once; sendmail() sends the bytes as-is, unlike send_message()
+        payload = msg.as_bytes()
+        # sendmail() takes the envelope addresses as given, so split a
+        # comma-separated EMAIL_TO and strip display names (as
+        # send_message() does from the headers)
+        sender = parseaddr(username)[1]
+        recipients = [addr for _, addr in getaddresses([recipient]) if addr]
+        with _smtp_lock:
+            try:
+                _get_smtp().sendmail(sender, recipients, payload)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the NOOP check and the send - reconnect once
+                _close_smtp()
+                _get_smtp().sendmail(sender, recipients, payload)
         
         print("✓ Email notification sent")
         return True
@@ -105,22 +254,20 @@ def send_ntfy_notification(message, title="New Apartment Listing"):
     Note:
         - Requires NTFY_TOPIC to be set in config.py or .env
         - Uses high priority for notifications
+        - Reuses a shared HTTP session (keep-alive) across notifications
         - Prints error messages but doesn't raise exceptions
         - See https://ntfy.sh for more information about the service
     """
-    if not config.NTFY_TOPIC:
+    if not _NTFY_READY:
         print("⚠ NTFY topic not configured")
         return False
     
     try:
-        url = f"https://ntfy.sh/{config.NTFY_TOPIC}"
-        response = requests.post(
-            url,
+        response = _get_ntfy_session().post(
+            _NTFY_URL,
             data=message.encode('utf-8'),
-            headers={
-                "Title": title,
-                "Priority": "high"
-            }
+            headers={"Title": title},
+            timeout=10
         )
         response.raise_for_status()
         print("✓ NTFY notification sent")
@@ -134,8 +281,10 @@ def send_system_notification(title="New Apartment Listing", message="New apartme
     """
     Send macOS system notification with optional sound.
     
-    Displays a native macOS notification using AppleScript. This provides
-    immediate visual and audio feedback when new apartments are found.
+    Displays a native macOS notification. This provides immediate visual and
+    audio feedback when new apartments are found. If pyobjc is installed the
+    notification is posted in-process via NSUserNotificationCenter;
+    otherwise it falls back to running AppleScript through osascript.
     
     Args:
         title (str, optional): Notification title. Defaults to
@@ -151,29 +300,39 @@ def send_system_notification(title="New Apartment Listing", message="New apartme
     
     Note:
         - Only works on macOS (Darwin)
-        - Automatically escapes special characters for AppleScript
-        - Uses osascript command-line tool
+        - Uses pyobjc (pyobjc-framework-Cocoa) if available and Python runs
+          with a notification center (app bundle), avoiding a process spawn
+          per notification
+        - Otherwise uses the osascript command-line tool and escapes special
+          characters for AppleScript
         - Prints error messages but doesn't raise exceptions
     """
-    if platform.system() != "Darwin":  # macOS
+    if not _IS_MAC:
         return False
     
+    if _notification_center is not None:
+        try:
+            note = NSUserNotification.alloc().init()
+            note.setTitle_(title)
+            note.setInformativeText_(message)
+            if sound:
+                note.setSoundName_("Glass")
+            _notification_center.deliverNotification_(note)
+            print("✓ System notification sent")
+            return True
+        except Exception as e:
+            print(f"⚠ Could not send system notification via pyobjc, using osascript: {e}")
+    
     try:
-        # Escape special characters for AppleScript
-        title_escaped = title.replace('"', '\\"')
-        message_escaped = message.replace('"', '\\"').replace('\n', ' ')
-        
-        # Build AppleScript command
-        if sound:
-            script = f'''
-            display notification "{message_escaped}" with title "{title_escaped}" sound name "Glass"
-            '''
-        else:
-            script = f'''
-            display notification "{message_escaped}" with title "{title_escaped}"
-            '''
+        # Escape special characters for AppleScript and fill in the template
+        template = _APPLESCRIPT_SOUND if sound else _APPLESCRIPT_SILENT
+        script = template.format(
+            message=message.translate(_APPLESCRIPT_ESCAPE),
+            title=title.translate(_APPLESCRIPT_ESCAPE)
+        )
         
         # Execute AppleScript
+        import subprocess
         subprocess.run(['osascript', '-e', script], check=True, capture_output=True)
         print("✓ System notification sent")
         return True
@@ -215,11 +374,94 @@ def send_notification(message, title="New Apartment Listing", html_message=None,
     send_system_notification(title, message, sound=True)
     
     # Also send via configured method (email or ntfy)
-    if config.NOTIFICATION_METHOD == "email":
-        return send_email_notification(message, title, html_message, image_url)
-    elif config.NOTIFICATION_METHOD == "ntfy":
-        return send_ntfy_notification(message, title)
-    else:
-        print(f"⚠ Unknown notification method: {config.NOTIFICATION_METHOD}")
+    return _send_via_configured_method(message, title, html_message, image_url)
+
+
+def send_notification_batch(items, title=None):
+    """
+    Send one notification covering several listings.
+    
+    When a scrape finds several new listings at once, sending them one by one
+    means one SMTP send or ntfy request per listing. This combines them into
+    a single email (one HTML section per listing) or a single ntfy message
+    instead.
+    
+    Args:
+        items (list[dict]): One entry per listing, each containing:
+            - message (str): Plain text message for the listing
+            - html_body (str): HTML fragment for the listing (the content of
+              <body>, see wrap_html_document())
+            - image_url (str, optional): URL to the apartment image
+        title (str, optional): Notification title / email subject. Defaults
+            to "New Apartment Listing" for a single item and
+            "N New Apartment Listings" otherwise.
+    
+    Returns:
+        bool: True if the notification was sent successfully via the
+            configured method, False otherwise (also False for no items).
+    
+    Note:
+        - Does not send a macOS system notification; callers are expected to
+          send one summary notification themselves
+        - A single item is sent exactly like a per-listing notification
+    """
+    if not items:
         return False
+    
+    if len(items) == 1:
+        item = items[0]
+        return _send_via_configured_method(
+            item["message"],
+            title or "New Apartment Listing",
+            wrap_html_document(item["html_body"]),
+            item.get("image_url")
+        )
+    
+    title = title or f"{len(items)} New Apartment Listings"
+    message = "\n".join(item["message"] for item in items)
+    html_message = wrap_html_document("\n    <hr>\n".join(item["html_body"] for item in items))
+    return _send_via_configured_method(message, title, html_message)
+
+
+def wrap_html_document(body):
+    """
+    Wrap an HTML body fragment into a complete HTML document for email.
+    
+    Args:
+        body (str): HTML content to place inside <body>
+    
+    Returns:
+        str: Complete HTML document.
+    """
+    return f"""<html>
+<head></head>
+<body>
+{body}
+</body>
+</html>"""
+
+
+def _send_via_email(message, title, html_message=None, image_url=None):
+    """Send via email; see send_email_notification()."""
+    return send_email_notification(message, title, html_message, image_url)
+
+
+def _send_via_ntfy(message, title, html_message=None, image_url=None):
+    """Send via ntfy.sh; HTML and image are not supported and ignored."""
+    return send_ntfy_notification(message, title)
+
+
+def _send_via_unknown(message, title, html_message=None, image_url=None):
+    """Fallback for an unsupported NOTIFICATION_METHOD."""
+    print(f"⚠ Unknown notification method: {config.NOTIFICATION_METHOD}")
+    return False
+
+
+_NOTIFICATION_METHODS = {
+    "email": _send_via_email,
+    "ntfy": _send_via_ntfy,
+}
 
+# The method can't change while running, so pick the sender once at import
+_send_via_configured_method = _NOTIFICATION_METHODS.get(config.NOTIFICATION_METHOD, _send_via_unknown)
+"""Send a notification via config.NOTIFICATION_METHOD (email or ntfy)."""
@@ -24,11 +24,17 @@ Example:
     >>> new_count = scrape_apartments()
     >>> print(f"Found {new_count} new listings")
 """
+import re
+import json
 import time
+import logging
+import atexit
 import random
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import quote_plus
+from urllib.parse import parse_qsl, quote_plus, urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -36,7 +42,280 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
 import config
-from notifications import send_notification
+from notifications import send_notification, send_notification_batch, send_system_notification, wrap_html_document
+
+log = logging.getLogger("scraper")
+"""Logger for scraper output. Per-listing and per-step details are logged at
+DEBUG level; see configure_logging()."""
+
+_driver = None
+"""Chrome WebDriver shared across scrapes (see get_driver)."""
+
+_driver_lock = threading.Lock()
+
+_privacy_accepted = False
+"""Whether the cookie banner was already accepted in the shared driver."""
+
+_results_url = None
+"""URL of the filtered results page, if the search filters are encoded in it."""
+
+_db = None
+"""SQLite connection shared by the database functions (see _get_db)."""
+
+_db_lock = threading.Lock()
+
+_SCHEMA_VERSION = 2
+"""Database schema version, stored in PRAGMA user_version (see init_database)."""
+
+_CREATE_LISTINGS_SQL = """
+    CREATE TABLE {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT UNIQUE,
+        title TEXT,
+        address TEXT,
+        price TEXT,
+        rooms TEXT,
+        area TEXT,
+        extra_costs TEXT,
+        brutto_miete_kalt TEXT,
+        wbs TEXT,
+        image_url TEXT,
+        raw_text TEXT,
+        first_seen INTEGER,
+        last_seen INTEGER,
+        notified INTEGER DEFAULT 0
+    )
+"""
+"""Current schema of the listings table ({table}: table name to create)."""
+
+_RESULTS_STATE_FN = """
+const resultsState = () => {
+    const counter = document.evaluate(
+        "//span[contains(text(), 'Wohnungen')]", document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const first = document.querySelector("div[id^='apartment-']");
+    return (counter ? counter.textContent.trim() : '') + '|' + (first ? first.id : '');
+};
+"""
+"""JS function resultsState(): the results counter text and the id of the
+first listing ("<counter>|<id>", empty parts if missing). The unfiltered
+list is already rendered before a search is submitted, so the search is
+only done once this changes."""
+
+_RESULTS_STATE_JS = _RESULTS_STATE_FN + "return resultsState();"
+"""Returns resultsState() of the current page."""
+
+# Fills the search form, submits it and waits for Livewire to re-render the
+# results, all inside the browser (one round-trip; a MutationObserver
+# reacts immediately instead of Selenium polling). Assigning .value doesn't
+# trigger per-keystroke updates; one input/change/blur event per field then
+# lets Livewire sync the value once, whichever wire:model modifier it uses.
+# The unfiltered results are already rendered and the field events can
+# re-render them too, so the results only count as loaded once the filter
+# modal is closed and resultsState() differs from its value right before
+# the click.
+# arguments[0]: list of [field name, value] pairs
+# arguments[1]: milliseconds to wait for the results
+# Calls back with {missing: [field names not found], submitted: bool,
+# results: bool, before: resultsState() before the click}.
+_FILL_AND_SUBMIT_JS = _RESULTS_STATE_FN + """
+const [fields, timeoutMs, done] = arguments;
+const missing = [];
+for (const [name, value] of fields) {
+    const field = document.querySelector(`[name="${name}"]`);
+    if (!field) {
+        missing.push(name);
+        continue;
+    }
+    field.value = value;
+    for (const type of ['input', 'change', 'blur']) {
+        field.dispatchEvent(new Event(type, {bubbles: true}));
+    }
+}
+const submit = [...document.querySelectorAll("button[type='submit']")]
+    .find(b => b.textContent.includes('Wohnung suchen'))
+    || document.querySelector("form button[type='submit']");
+if (!submit) {
+    done({missing: missing, submitted: false, results: false, before: null});
+    return;
+}
+const modalClosed = () => {
+    const heading = document.evaluate(
+        "//span[contains(text(), 'Meine Suchkriterien')]", document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return !heading || heading.getClientRects().length === 0;
+};
+const before = resultsState();
+const hasResults = () => {
+    const state = resultsState();
+    return modalClosed() && !state.startsWith('|') && state !== before;
+};
+let finished = false;
+const finish = results => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    done({missing: missing, submitted: true, results: results, before: before});
+};
+// Check on every DOM change after the click (new results, modal hidden)
+const observer = new MutationObserver(() => {
+    if (hasResults()) {
+        finish(true);
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+setTimeout(() => finish(hasResults()), timeoutMs);
+submit.click();
+"""
+
+_SUBMIT_TIMEOUT_MS = 20000
+"""How long the form submit script waits for the results to render."""
+
+_POLL_FREQUENCY = 0.1
+"""Seconds between condition checks of explicit waits (Selenium default: 0.5).
+Livewire usually renders within 100-200 ms, so short polls return sooner."""
+
+_RESULTS_POLL_FREQUENCY = 0.25
+"""Poll interval for the slower "results loaded" waits; fewer round-trips."""
+
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+    "*.woff", "*.woff2", "*.ttf",
+    "*/gtag/*", "*googletagmanager*", "*google-analytics*",
+]
+"""Resources the browser never downloads (images, web fonts, analytics).
+The scraper only needs the HTML; image URLs are read from wire:snapshot."""
+
+
+# Patterns used by extract_listings(), compiled once at import time.
+# Listing text format: "X,0 Zimmer, Y,YY m², Z.ZZZ,ZZ € | Address"
+_ROOMS_RE = re.compile(r'(\d+(?:,\d+)?)\s*Zimmer', re.IGNORECASE)
+_AREA_RE = re.compile(r'(\d+(?:,\d+)?)\s*m²')
+_PRICE_RE = re.compile(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*€')
+_ADDRESS_RE = re.compile(r'\|\s*([^|]+)')
+# First "deeplink" string in a wire:snapshot, escapes included (cheap
+# lookup used to skip already-known listings without a full JSON parse)
+_DEEPLINK_RE = re.compile(r'"deeplink"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+# Collects everything extract_listings() needs from the listings in one
+# WebDriver round-trip instead of several calls per listing.
+# arguments[0]: list of apartment-* container divs (or, from the fallback
+# selectors, listing buttons)
+_EXTRACT_LISTINGS_JS = """
+const hosts = ['degewo', 'gesobau', 'gewobag', 'howoge', 'stadtundland', 'wbm'];
+return arguments[0].map(el => {
+    const container = el.matches("div[id^='apartment-']") ? el : el.closest("div[id^='apartment-']");
+    const button = (container && container.querySelector('button.list__item__title')) || el;
+    const item = {
+        text: (button.innerText || '').trim(),
+        ariaLabel: button.getAttribute('aria-label'),
+        inListing: !!container,
+        snapshot: null,
+        imageSnapshots: [],
+        deeplinks: [],
+        details: []
+    };
+    if (!container) {
+        return item;
+    }
+    item.snapshot = container.getAttribute('wire:snapshot');
+    for (const div of container.getElementsByTagName('div')) {
+        const wireId = div.getAttribute('wire:id') || '';
+        const cls = div.getAttribute('class') || '';
+        const snap = div.getAttribute('wire:snapshot');
+        if ((wireId.includes('image') || cls.includes('image')) && snap) {
+            item.imageSnapshots.push(snap);
+        }
+    }
+    for (const a of container.getElementsByTagName('a')) {
+        const href = a.getAttribute('href') || '';
+        if (hosts.some(h => href.includes(h))) {
+            item.deeplinks.push(a.href);
+        }
+    }
+    for (const dl of container.getElementsByTagName('dl')) {
+        if (dl.getAttribute('class') !== 'grid grid-cols-2') {
+            continue;
+        }
+        for (const dt of dl.getElementsByTagName('dt')) {
+            let dd = dt.nextElementSibling;
+            while (dd && dd.tagName !== 'DD') {
+                dd = dd.nextElementSibling;
+            }
+            if (dd) {
+                item.details.push([dt.innerText.trim(), dd.innerText.trim()]);
+            }
+        }
+    }
+    return item;
+});
+"""
+
+
+def _parse_snapshot(snapshot_attr):
+    """
+    Pull the fields extract_listings() needs out of a Livewire wire:snapshot.
+    
+    The snapshot is a JSON document. It is parsed once and walked
+    depth-first; the first occurrence of each field wins. Livewire
+    wraps arrays as ``[value, meta]`` pairs, which the walk handles
+    transparently.
+    
+    Args:
+        snapshot_attr (str): Value of the wire:snapshot attribute as read
+            from the DOM (HTML entities are already decoded).
+    
+    Returns:
+        dict: Any of the keys "deeplink", "extraCosts", "imagePath",
+            "imageUrl" and "wbs" that were found, with string values.
+    
+    Raises:
+        ValueError: If the attribute is not valid JSON.
+    """
+    found = {}
+    stack = [json.loads(snapshot_attr)]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in ("deeplink", "extraCosts", "imagePath", "imageUrl"):
+                value = node.get(key)
+                if key not in found and isinstance(value, str) and value:
+                    found[key] = value
+            # Details entries look like {"label": "WBS", ..., "value": "..."}
+            if "wbs" not in found and node.get("label") == "WBS":
+                value = node.get("value")
+                if isinstance(value, str) and value:
+                    found["wbs"] = value
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return found
+
+
+def _snapshot_deeplink(snapshot_attr):
+    """
+    Return the deeplink from a wire:snapshot without parsing the whole JSON.
+    
+    Args:
+        snapshot_attr (str): Value of the wire:snapshot attribute as read
+            from the DOM (HTML entities are already decoded), or None.
+    
+    Returns:
+        str: The deeplink URL (JSON string escapes decoded), or None if
+            there is none.
+    """
+    if not snapshot_attr:
+        return None
+    match = _DEEPLINK_RE.search(snapshot_attr)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1)) or None
+    except ValueError:
+        return None
 
 
 def init_driver():
@@ -48,6 +327,12 @@ def init_driver():
     - Avoid detection as automation
     - Use a realistic user agent
     - Disable automation flags
+    - Keep a persistent profile (config.CHROME_PROFILE_DIR) so cookies,
+      including the accepted privacy settings, survive browser restarts
+    - Skip downloading images, web fonts and analytics scripts
+      (see _BLOCKED_URL_PATTERNS)
+    - Return from driver.get() once the DOM is ready ("eager" page load
+      strategy); later steps wait explicitly for the elements they need
     
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver instance
@@ -56,6 +341,8 @@ def init_driver():
         Exception: If ChromeDriver is not found or Chrome cannot be started
     """
     chrome_options = Options()
+    # Don't wait for window.onload (images, iframes, tracking pings)
+    chrome_options.page_load_strategy = "eager"
     if config.HEADLESS_BROWSER:
         chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -63,21 +350,109 @@ def init_driver():
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f"--user-data-dir={config.CHROME_PROFILE_DIR}")
+    # Don't load images at all (2 = block)
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     
     # User agent to appear more like a real browser
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
     driver = webdriver.Chrome(options=chrome_options)
+    
+    # Block fonts, analytics and any images the preference above misses
+    block_resources(driver)
     return driver
 
 
+def block_resources(driver):
+    """
+    Stop the browser from downloading resources the scraper doesn't need.
+    
+    Blocks the URLs in _BLOCKED_URL_PATTERNS (images, web fonts, analytics)
+    via the Chrome DevTools protocol, before any request is sent.
+    
+    Args:
+        driver (webdriver.Chrome): The Selenium WebDriver instance
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+
+
+def get_driver():
+    """
+    Return the shared Chrome WebDriver, starting it on first use.
+    
+    Starting Chrome and ChromeDriver is one of the slowest parts of a scrape,
+    so a single browser is kept open between scrapes and reused. It is
+    closed by close_driver(), which also runs at interpreter exit.
+    
+    Returns:
+        webdriver.Chrome: The shared WebDriver instance
+    
+    Raises:
+        Exception: If ChromeDriver is not found or Chrome cannot be started
+    """
+    global _driver
+    
+    with _driver_lock:
+        if _driver is None:
+            _driver = init_driver()
+        return _driver
+
+
+def close_driver():
+    """
+    Quit the shared Chrome WebDriver, if one is running.
+    
+    Also forgets the per-browser state (privacy acceptance and results URL),
+    so the next scrape starts from scratch. Called after a failed scrape,
+    when the browser may be in an unknown state, and at interpreter exit.
+    """
+    global _driver, _privacy_accepted, _results_url
+    
+    with _driver_lock:
+        if _driver is not None:
+            try:
+                _driver.quit()
+            except Exception as e:
+                log.warning(f"⚠ Error closing browser: {e}")
+            _driver = None
+        _privacy_accepted = False
+        _results_url = None
+
+
+atexit.register(close_driver)
+
+
+def _save_debug_page(driver, name):
+    """
+    Save the current page source to debug_<name>_<timestamp>.html.
+    
+    Only called when config.DEBUG_SCRAPER is set: driver.page_source copies
+    the whole DOM (several MB) out of the browser. The timestamp keeps
+    repeated failures from overwriting each other.
+    
+    Args:
+        driver (webdriver.Chrome): The Selenium WebDriver instance
+        name (str): Short description of the failure (e.g., "submit_failed")
+    """
+    filename = f"debug_{name}_{int(time.time())}.html"
+    try:
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(driver.page_source)
+        log.warning(f"⚠ Saved page source to {filename} for inspection")
+    except Exception as e:
+        log.warning(f"⚠ Could not save page source: {e}")
+
+
 def accept_privacy_settings(driver, wait_time=10):
     """
     Accept privacy/cookie settings by clicking the 'Alle akzeptieren' button.
     
     This function handles the cookie consent banner that appears on the website.
-    It tries multiple selector strategies to find the accept button, as the site
-    uses Livewire components that may render differently.
+    The accept button is matched by its id, its Livewire wire:click attribute
+    or its text in a single wait, as the site uses Livewire components that
+    may render differently.
     
     Args:
         driver (webdriver.Chrome): The Selenium WebDriver instance
@@ -94,29 +469,22 @@ def accept_privacy_settings(driver, wait_time=10):
     """
     try:
         # Wait for privacy banner to appear and Livewire to be ready
-        wait = WebDriverWait(driver, wait_time)
-        
-        # Wait a bit for Livewire to initialize
-        time.sleep(2)
+        # (the clickable waits below cover Livewire initialization)
+        wait = WebDriverWait(driver, wait_time, poll_frequency=_POLL_FREQUENCY)
         
-        # Try multiple strategies to find the accept button
-        # The button has id="accept-all-cookies" and contains a span with "Alle akzeptieren"
-        # It's a Livewire component with wire:click="onCookieAll"
-        accept_selectors = [
-            (By.ID, "accept-all-cookies"),
-            (By.XPATH, "//button[@id='accept-all-cookies']"),
-            (By.XPATH, "//button[@wire:click='onCookieAll']"),
-            (By.XPATH, "//button[.//span[contains(text(), 'Alle akzeptieren')]]"),
-            (By.XPATH, "//button[contains(text(), 'Alle akzeptieren')]"),
-        ]
-        
-        accept_button = None
-        for by, selector in accept_selectors:
-            try:
-                accept_button = wait.until(EC.element_to_be_clickable((by, selector)))
-                break
-            except Exception:
-                continue
+        # The button has id="accept-all-cookies", is a Livewire component
+        # with wire:click="onCookieAll" and contains "Alle akzeptieren".
+        # EC.any_of checks all alternatives on every poll, so there is a
+        # single wait instead of one timeout per fallback
+        try:
+            accept_button = wait.until(EC.any_of(
+                EC.element_to_be_clickable(
+                    (By.CSS_SELECTOR, "#accept-all-cookies, button[wire\\:click='onCookieAll']")
+                ),
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Alle akzeptieren')]")),
+            ))
+        except TimeoutException:
+            accept_button = None
         
         if accept_button:
             # Try regular click first
@@ -126,17 +494,21 @@ def accept_privacy_settings(driver, wait_time=10):
                 # If regular click fails, use JavaScript click (more reliable for Livewire)
                 driver.execute_script("arguments[0].click();", accept_button)
             
-            print("✓ Privacy settings accepted")
-            time.sleep(3 + random.uniform(0, 1))  # Wait for banner to disappear and Livewire to process
+            log.debug("✓ Privacy settings accepted")
+            # Wait for banner to disappear and Livewire to process
+            try:
+                WebDriverWait(driver, 5, poll_frequency=_POLL_FREQUENCY).until(EC.invisibility_of_element_located((By.ID, "accept-all-cookies")))
+            except TimeoutException:
+                log.warning("⚠ Privacy banner still visible, continuing anyway...")
             return True
         else:
-            print("⚠ Privacy banner not found (might already be accepted)")
+            log.warning("⚠ Privacy banner not found (might already be accepted)")
             return False
     except TimeoutException:
-        print("⚠ Privacy banner not found (might already be accepted)")
+        log.warning("⚠ Privacy banner not found (might already be accepted)")
         return False
     except Exception as e:
-        print(f"⚠ Error accepting privacy settings: {e}")
+        log.warning(f"⚠ Error accepting privacy settings: {e}")
         return False
 
 
@@ -158,40 +530,38 @@ def open_search_filters(driver, wait_time=10):
             False if the button could not be found or clicked.
     
     Note:
-        After clicking, the function waits a random amount of time (2-3 seconds)
-        to allow the modal to fully open and render.
+        After clicking, the function waits until the modal heading
+        ('Meine Suchkriterien') is visible instead of sleeping a fixed time.
     """
     try:
-        wait = WebDriverWait(driver, wait_time)
+        wait = WebDriverWait(driver, wait_time, poll_frequency=_POLL_FREQUENCY)
         
         # Find the "Suchfilter" button - it has aria-label="Suchfilter" and opens a modal
-        filter_selectors = [
-            (By.XPATH, "//button[@aria-label='Suchfilter']"),
-            (By.XPATH, "//button[contains(@class, 'button--icon') and .//i[contains(@class, 'fa-search')]]"),
-            (By.XPATH, "//button[.//span[contains(text(), 'Suchfilter')]]"),
-        ]
-        
-        filter_button = None
-        for by, selector in filter_selectors:
-            try:
-                filter_button = wait.until(EC.element_to_be_clickable((by, selector)))
-                break
-            except Exception:
-                continue
+        try:
+            filter_button = wait.until(EC.any_of(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Suchfilter']")),
+                EC.element_to_be_clickable((By.XPATH, "//button[.//span[contains(text(), 'Suchfilter')]]")),
+            ))
+        except TimeoutException:
+            filter_button = None
         
         if filter_button:
             filter_button.click()
-            print("✓ Search filters opened")
-            time.sleep(2 + random.uniform(0, 1))  # Wait for filter panel/modal to open
+            log.debug("✓ Search filters opened")
+            # Wait for filter panel/modal to open
+            try:
+                wait.until(EC.visibility_of_element_located((By.XPATH, "//span[contains(text(), 'Meine Suchkriterien')]")))
+            except TimeoutException:
+                log.warning("⚠ Filter modal not visible yet, continuing anyway...")
             return True
         else:
-            print("✗ Could not find 'Suchfilter' button")
+            log.error("✗ Could not find 'Suchfilter' button")
             return False
     except TimeoutException:
-        print("✗ Could not find 'Suchfilter' button")
+        log.error("✗ Could not find 'Suchfilter' button")
         return False
     except Exception as e:
-        print(f"✗ Error opening search filters: {e}")
+        log.error(f"✗ Error opening search filters: {e}")
         return False
 
 
@@ -219,149 +589,179 @@ def set_search_criteria(driver, wait_time=15):
     
     Note:
         - Uses JavaScript clicks for better compatibility with Livewire
-        - Scrolls elements into view before interacting
-        - Includes random delays to appear more human-like
-        - Saves page source to debug file if submission fails
+        - Fills all fields, submits and waits for the results with a single
+          async script call; the values are set directly and one
+          input/change/blur event is dispatched per field (no per-keystroke
+          Livewire updates)
+        - Falls back to finding and clicking the submit button from Python
+          if the script could not submit the form
+        - Scrolls the submit button into view before clicking
+        - Waits for explicit page conditions rather than fixed delays
+        - Saves page source to debug file if submission fails and
+          config.DEBUG_SCRAPER is set
     """
     try:
-        wait = WebDriverWait(driver, wait_time)
+        wait = WebDriverWait(driver, wait_time, poll_frequency=_POLL_FREQUENCY)
         
         # Wait for modal to be visible - look for "Meine Suchkriterien" heading
-        print("Waiting for filter modal to fully load...")
+        log.debug("Waiting for filter modal to fully load...")
         try:
             wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Meine Suchkriterien')]")))
-            print("✓ Modal is visible")
+            log.debug("✓ Modal is visible")
         except Exception:
-            print("⚠ Modal heading not found, continuing anyway...")
-        
-        time.sleep(2)  # Additional wait for form fields to be ready
-        
-        # Set Kaltmiete maximum - use the actual field name from the website
-        try:
-            kaltmiete_max = wait.until(
-                EC.presence_of_element_located((By.NAME, "searchParams.rentNet.max"))
-            )
-            # Scroll into view and wait for it to be visible
-            driver.execute_script("arguments[0].scrollIntoView(true);", kaltmiete_max)
-            time.sleep(0.5)
-            kaltmiete_max.clear()
-            kaltmiete_max.send_keys(str(config.SEARCH_CRITERIA["kaltmiete_max"]))
-            print(f"✓ Set Cold rent max to {config.SEARCH_CRITERIA['kaltmiete_max']} €")
-        except Exception as e:
-            print(f"⚠ Could not set Cold rent max: {e}")
-        
-        # Set Zimmer minimum
-        try:
-            zimmer_min = wait.until(
-                EC.presence_of_element_located((By.NAME, "searchParams.rooms.min"))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", zimmer_min)
-            time.sleep(0.5)
-            zimmer_min.clear()
-            zimmer_min.send_keys(str(config.SEARCH_CRITERIA["zimmer_min"]))
-            print(f"✓ Set Number of rooms min to {config.SEARCH_CRITERIA['zimmer_min']}")
-        except Exception as e:
-            print(f"⚠ Could not set Number of rooms min: {e}")
+            log.warning("⚠ Modal heading not found, continuing anyway...")
         
-        # Set Zimmer maximum
+        # Wait for form fields to be ready
         try:
-            zimmer_max = wait.until(
-                EC.presence_of_element_located((By.NAME, "searchParams.rooms.max"))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", zimmer_max)
-            time.sleep(0.5)
-            zimmer_max.clear()
-            zimmer_max.send_keys(str(config.SEARCH_CRITERIA["zimmer_max"]))
-            print(f"✓ Set Number of rooms max to {config.SEARCH_CRITERIA['zimmer_max']}")
-        except Exception as e:
-            print(f"⚠ Could not set Number of rooms max: {e}")
+            wait.until(EC.element_to_be_clickable((By.NAME, "searchParams.rentNet.max")))
+        except TimeoutException:
+            log.warning("⚠ Form fields not clickable yet, continuing anyway...")
         
-        # Set Wohnfläche maximum
+        # Fill all four fields, submit and wait for the results in one
+        # round-trip (instead of locate, scroll, clear and per-character
+        # send_keys for each field, then several waits after submitting)
+        criteria = config.SEARCH_CRITERIA
+        fields = [
+            # (field name, label, value, unit)
+            ("searchParams.rentNet.max", "Cold rent max", criteria.kaltmiete_max, " €"),
+            ("searchParams.rooms.min", "Number of rooms min", criteria.zimmer_min, ""),
+            ("searchParams.rooms.max", "Number of rooms max", criteria.zimmer_max, ""),
+            ("searchParams.area.max", "Living area max", criteria.wohnflaeche_max, " m²"),
+        ]
         try:
-            wohnflaeche_max = wait.until(
-                EC.presence_of_element_located((By.NAME, "searchParams.area.max"))
+            driver.set_script_timeout(_SUBMIT_TIMEOUT_MS / 1000 + 5)
+            outcome = driver.execute_async_script(
+                _FILL_AND_SUBMIT_JS,
+                [[name, str(value)] for name, _, value, _ in fields],
+                _SUBMIT_TIMEOUT_MS,
             )
-            driver.execute_script("arguments[0].scrollIntoView(true);", wohnflaeche_max)
-            time.sleep(0.5)
-            wohnflaeche_max.clear()
-            wohnflaeche_max.send_keys(str(config.SEARCH_CRITERIA["wohnflaeche_max"]))
-            print(f"✓ Set Living area max to {config.SEARCH_CRITERIA['wohnflaeche_max']} m²")
+            for name, label, value, unit in fields:
+                if name in outcome["missing"]:
+                    log.debug(f"⚠ Could not set {label}: field {name} not found")
+                else:
+                    log.debug(f"✓ Set {label} to {value}{unit}")
+            
+            if outcome["submitted"]:
+                log.debug("✓ Search submitted")
+                if outcome["results"]:
+                    log.debug("✓ Results loaded")
+                else:
+                    _wait_for_results(wait, outcome["before"])
+                return True
         except Exception as e:
-            print(f"⚠ Could not set Living area max: {e}")
+            log.warning(f"⚠ Could not fill/submit search form via script: {e}")
         
-        # Submit the search form
+        # Fallback: submit the search form from Python
         # The form uses Livewire (wire:submit.prevent="submit") and the button has @click="showModal = false"
-        print("Looking for submit button...")
+        log.debug("Looking for submit button...")
         try:
-            # Wait for the submit button to be visible and clickable
-            # The button is inside the form and has type="submit" with text "Wohnung suchen"
-            # Try multiple selectors
-            search_button = None
-            button_selectors = [
-                "//button[@type='submit' and contains(., 'Wohnung suchen')]",
-                "//form//button[@type='submit']",
-                "//button[contains(., 'Wohnung suchen')]",
-            ]
-            
-            for selector in button_selectors:
-                try:
-                    search_button = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                    print(f"✓ Found submit button using: {selector}")
-                    break
-                except Exception:
-                    continue
-            
-            if not search_button:
-                raise Exception("Could not find submit button with any selector")
+            # Wait for the submit button ("Wohnung suchen") of the filter form
+            # to be clickable; alternatives are checked in order on each poll
+            search_button = wait.until(EC.any_of(
+                EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and contains(., 'Wohnung suchen')]")),
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "form button[type='submit']")),
+            ))
             
             # Scroll button into view
             driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
             time.sleep(0.5)
             
-            print("✓ Found submit button, clicking...")
+            log.debug("✓ Found submit button, clicking...")
             
             # Use JavaScript click for Livewire/Alpine.js components
+            before = driver.execute_script(_RESULTS_STATE_JS)
             driver.execute_script("arguments[0].click();", search_button)
             
-            print("✓ Search submitted")
-            time.sleep(3)  # Wait for modal to close
+            log.debug("✓ Search submitted")
             
             # Wait for results to load (modal should close and results should appear)
             try:
                 wait.until(EC.invisibility_of_element_located((By.XPATH, "//span[contains(text(), 'Meine Suchkriterien')]")))
-                print("✓ Modal closed, waiting for results...")
+                log.debug("✓ Modal closed, waiting for results...")
             except Exception:
-                print("⚠ Modal might still be visible, continuing...")
+                log.warning("⚠ Modal might still be visible, continuing...")
             
-            time.sleep(5 + random.uniform(0, 2))  # Additional wait for Livewire to process and results to render
+            _wait_for_results(wait, before)
             return True
         except Exception as e:
-            print(f"⚠ Could not find/submit search button: {e}")
+            log.warning(f"⚠ Could not find/submit search button: {e}")
             # Try alternative selectors
             try:
-                print("Trying alternative selectors...")
+                log.debug("Trying alternative selectors...")
                 # Try finding by text content
                 search_button = wait.until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Wohnung suchen')]"))
                 )
                 driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
                 time.sleep(0.5)
+                before = driver.execute_script(_RESULTS_STATE_JS)
                 driver.execute_script("arguments[0].click();", search_button)
-                print("✓ Search submitted (alternative method)")
-                time.sleep(5)
+                log.debug("✓ Search submitted (alternative method)")
+                _wait_for_results(wait, before)
                 return True
             except Exception as e2:
-                print(f"⚠ Alternative submit method also failed: {e2}")
+                log.warning(f"⚠ Alternative submit method also failed: {e2}")
                 # Debug: save page source
-                with open("debug_submit_failed.html", "w", encoding="utf-8") as f:
-                    f.write(driver.page_source)
-                print("⚠ Saved page source to debug_submit_failed.html")
+                if config.DEBUG_SCRAPER:
+                    _save_debug_page(driver, "submit_failed")
                 return False
         
     except Exception as e:
-        print(f"✗ Error setting search criteria: {e}")
-        import traceback
-        traceback.print_exc()
+        log.error(f"✗ Error setting search criteria: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
+        return False
+
+
+def _url_has_search_criteria(url):
+    """
+    Check whether a results URL carries the configured search criteria.
+    
+    Only such a URL may be reloaded instead of filling in the filter form;
+    a query with other parameters (pagination, tracking) would load the
+    unfiltered results.
+    
+    Args:
+        url (str): URL of the results page
+    
+    Returns:
+        bool: True if the query has a rentNet parameter with the configured
+            maximum cold rent.
+    """
+    rent_max = str(config.SEARCH_CRITERIA.kaltmiete_max)
+    return any(
+        "rentNet" in key and value == rent_max
+        for key, value in parse_qsl(urlparse(url).query)
+    )
+
+
+def _wait_for_results(wait, before=None):
+    """
+    Wait until Livewire has rendered the search results.
+    
+    The results counter ("Wir haben X Wohnungen gefunden") is already on the
+    page before the search is submitted (for the unfiltered list), so its
+    presence alone doesn't show that the new results arrived. With
+    ``before`` the wait lasts until the counter text or the first listing
+    differ from that state; this replaces a fixed sleep after submitting
+    the search form.
+    
+    Args:
+        wait (WebDriverWait): Wait bound to the current driver
+        before (str, optional): _RESULTS_STATE_JS result from before the
+            search was submitted. Defaults to None (only wait for the counter).
+    
+    Returns:
+        bool: True if the results appeared, False if the wait timed out.
+    """
+    def results_rendered(driver):
+        state = driver.execute_script(_RESULTS_STATE_JS)
+        # An empty counter part means the counter is not rendered (yet)
+        return not state.startswith("|") and state != before
+    
+    try:
+        wait.until(results_rendered)
+        return True
+    except TimeoutException:
+        log.warning("⚠ Results counter not found yet, continuing...")
         return False
 
 
@@ -414,7 +814,22 @@ def format_german_number(value):
         return "0,00"
 
 
-def extract_listings(driver):
+def _title_from(text, address):
+    """
+    Derive a listing title from its address or button text.
+    
+    Args:
+        text (str): Text of the listing button ("... | Address")
+        address (str): Parsed address, may be empty
+    
+    Returns:
+        str: The address if known, otherwise the text before the ``|``
+            separator (the whole text if there is none), at most 200 characters.
+    """
+    return (address or text.partition('|')[0].strip() or text)[:200]
+
+
+def extract_listings(driver, skip_known=False):
     """
     Extract apartment listing data from the current search results page.
     
@@ -436,6 +851,10 @@ def extract_listings(driver):
     
     Args:
         driver (webdriver.Chrome): The Selenium WebDriver instance
+        skip_known (bool, optional): If True, listings whose deeplink is
+            already in the database are not parsed; they are returned with
+            only url, raw_text and extracted_at filled in (enough for
+            save_listings() to update last_seen). Defaults to False.
     
     Returns:
         list[dict]: List of dictionaries, each containing:
@@ -456,85 +875,100 @@ def extract_listings(driver):
         - Gracefully handles end of listings (when no more are available)
         - Skips listings without identifying information
         - Saves page source to debug file if extraction fails completely
+          and config.DEBUG_SCRAPER is set (DEBUG_SCRAPER=1)
         - Returns empty list if no listings found
     """
     listings = []
     
     try:
-        print("\n=== EXTRACTING LISTINGS ===\n")
+        log.debug("=== EXTRACTING LISTINGS ===")
         
         # Wait for listings to load
-        wait = WebDriverWait(driver, 20)
+        wait = WebDriverWait(driver, 20, poll_frequency=_RESULTS_POLL_FREQUENCY)
         
         # First, wait for the results counter or any indication that results have loaded
-        print("Waiting for results to appear...")
+        log.debug("Waiting for results to appear...")
         try:
             # Wait for results counter text like "Wir haben X Wohnungen gefunden"
             wait.until(EC.presence_of_element_located((By.XPATH, 
                 "//span[contains(text(), 'Wohnungen')]")))
-            print("✓ Results counter found")
-            time.sleep(2)  # Give Livewire a moment to render listings
+            log.debug("✓ Results counter found")
         except Exception as e:
-            print(f"⚠ Results counter not found: {e}")
-            time.sleep(3)  # Wait anyway
+            log.warning(f"⚠ Results counter not found: {e}")
         
         # Wait for listing buttons to appear
-        print("Waiting for listing buttons...")
+        log.debug("Waiting for listing buttons...")
         try:
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 
                 "button.list__item__title")))
-            print("✓ Listing buttons found")
-            time.sleep(1)  # Small additional wait for full rendering
+            log.debug("✓ Listing buttons found")
         except Exception as e:
-            print(f"⚠ Listing buttons not found immediately: {e}")
-            print("Trying alternative selectors...")
-            time.sleep(3)
+            log.warning(f"⚠ Listing buttons not found immediately: {e}")
+            log.debug("Trying alternative selectors...")
         
-        # Try multiple selectors to find listing buttons
-        listing_buttons = []
+        # Find the listings, top-down: the apartment-* container divs are the
+        # unit of iteration (no per-listing ancestor lookup). The button
+        # selectors are fallbacks in case the container ids change.
+        # No waits here: the presence wait above has already given the page
+        # its full timeout.
+        listing_elements = []
         selectors_to_try = [
+            (By.CSS_SELECTOR, "div[id^='apartment-']"),
             (By.CSS_SELECTOR, "button.list__item__title"),
             (By.XPATH, "//button[contains(@class, 'list__item__title')]"),
             (By.XPATH, "//button[contains(@class, 'list__item')]"),
-            (By.XPATH, "//div[starts-with(@id, 'apartment-')]//button"),
         ]
         
         for by, selector in selectors_to_try:
             try:
-                buttons = driver.find_elements(by, selector)
-                if buttons:
-                    listing_buttons = buttons
-                    print(f"✓ Found {len(buttons)} listing buttons using: {selector}")
+                elements = driver.find_elements(by, selector)
+                if elements:
+                    listing_elements = elements
+                    log.debug(f"✓ Found {len(elements)} listings using: {selector}")
                     break
             except Exception as e:
-                print(f"  Selector failed: {selector} - {e}")
+                log.debug(f"  Selector failed: {selector} - {e}")
                 continue
         
-        if not listing_buttons:
-            print("⚠ No listing buttons found with any selector")
+        if not listing_elements:
+            log.warning("⚠ No listings found with any selector")
+            if not config.DEBUG_SCRAPER:
+                log.warning("  Set DEBUG_SCRAPER=1 to save the page source for inspection")
+                return []
+            
             # Save page source for debugging
-            with open("debug_extraction_failed.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("⚠ Saved page source to debug_extraction_failed.html for inspection")
+            _save_debug_page(driver, "extraction_failed")
             
             # Try to find what's actually on the page
-            print("\nDebugging: Checking what elements are present...")
+            log.info("Debugging: Checking what elements are present...")
             try:
                 all_buttons = driver.find_elements(By.TAG_NAME, "button")
-                print(f"  Total buttons on page: {len(all_buttons)}")
+                log.info(f"  Total buttons on page: {len(all_buttons)}")
                 for i, btn in enumerate(all_buttons[:10]):
                     classes = btn.get_attribute("class") or ""
                     text = btn.text[:50] or ""
                     if "list" in classes.lower() or "item" in classes.lower():
-                        print(f"  Button {i+1}: class='{classes[:50]}', text='{text}'")
+                        log.info(f"  Button {i+1}: class='{classes[:50]}', text='{text}'")
             except Exception:
                 pass
             
             return []
         
-        print(f"Found {len(listing_buttons)} listing buttons, processing...")
+        log.debug(f"Found {len(listing_elements)} listings, processing...")
         
-        for idx, button in enumerate(listing_buttons):
+        # Read everything we need from the DOM in a single round-trip
+        raw_listings = driver.execute_script(_EXTRACT_LISTINGS_JS, listing_elements)
+        
+        # All listings of one scrape share the same extraction timestamp
+        extracted_at = datetime.now().isoformat()
+        
+        # Look up all deeplinks in the database at once, so the detail parsing
+        # below only runs for listings we haven't seen before
+        deeplinks = [_snapshot_deeplink(raw["snapshot"]) for raw in raw_listings]
+        known_urls = get_known_listing_urls([url for url in deeplinks if url]) if skip_known else set()
+        skipped_known = 0
+        
+        for idx, raw in enumerate(raw_listings):
             try:
                 listing_data = {
                     "url": None,
@@ -548,71 +982,67 @@ def extract_listings(driver):
                     "wbs": "",
                     "image_url": "",
                     "raw_text": "",
-                    "extracted_at": datetime.now().isoformat()
+                    "extracted_at": extracted_at
                 }
                 
-                # Extract text content from the button
-                text = button.text.strip()
+                # A (fallback) button without a parent div id="apartment-XXXX"
+                # means we've reached the end of available listings
+                if not raw["inListing"]:
+                    # No more listings available - this is expected after the first page
+                    log.debug(f"  ✓ Reached end of listings at {idx+1} listings")
+                    break
+                
+                # Text content of the listing button
+                text = raw["text"]
                 listing_data["raw_text"] = text
                 
-                # Parse the text format: "X,0 Zimmer, Y,YY m², Z.ZZZ,ZZ € | Address"
-                import re
+                # Already in the database: no need to parse the details
+                if deeplinks[idx] in known_urls:
+                    listing_data["url"] = deeplinks[idx]
+                    listings.append(listing_data)
+                    skipped_known += 1
+                    continue
                 
+                # Parse the text format: "X,0 Zimmer, Y,YY m², Z.ZZZ,ZZ € | Address"
                 # Extract rooms (format: "X,0 Zimmer")
-                rooms_match = re.search(r'(\d+(?:,\d+)?)\s*Zimmer', text, re.IGNORECASE)
+                rooms_match = _ROOMS_RE.search(text)
                 if rooms_match:
                     listing_data["rooms"] = rooms_match.group(1)
                 
                 # Extract area (format: "Y,YY m²")
-                area_match = re.search(r'(\d+(?:,\d+)?)\s*m²', text)
+                area_match = _AREA_RE.search(text)
                 if area_match:
                     listing_data["area"] = area_match.group(1)
                 
                 # Extract price (format: "Z.ZZZ,ZZ €" or "Z.ZZZ,ZZ €")
-                price_match = re.search(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*€', text)
+                price_match = _PRICE_RE.search(text)
                 if price_match:
                     listing_data["price"] = price_match.group(1)
                 
                 # Extract address (format: "Street Number, ZIP City" after the | separator)
-                address_match = re.search(r'\|\s*([^|]+)', text)
+                address_match = _ADDRESS_RE.search(text)
                 if address_match:
                     listing_data["address"] = address_match.group(1).strip()
                 
-                # Try to find the parent div with id="apartment-XXXX"
-                # If we can't find it, it means we've reached the end of available listings
-                try:
-                    parent_div = button.find_element(By.XPATH, "./ancestor::div[starts-with(@id, 'apartment-')]")
-                except Exception:
-                    # No more listings available - this is expected after the first page
-                    print(f"  ✓ Reached end of listings at {idx+1} listings")
-                    break
-                
                 # Extract data from wire:snapshot (most reliable source)
                 try:
-                    snapshot_attr = parent_div.get_attribute("wire:snapshot")
+                    snapshot_attr = raw["snapshot"]
                     if snapshot_attr:
+                        snapshot = _parse_snapshot(snapshot_attr)
+                        
                         # Extract deeplink
-                        deeplink_match = re.search(r'"deeplink"\s*:\s*"([^"]+)"', snapshot_attr)
-                        if deeplink_match:
-                            listing_data["url"] = deeplink_match.group(1).replace('\\/', '/')
+                        if "deeplink" in snapshot:
+                            listing_data["url"] = snapshot["deeplink"]
                         
                         # Extract extraCosts (Nebenkosten kalt)
-                        extra_costs_match = re.search(r'"extraCosts"\s*:\s*"([^"]+)"', snapshot_attr)
-                        if extra_costs_match:
-                            extra_costs_value = extra_costs_match.group(1).replace('\\/', '/')
+                        if "extraCosts" in snapshot:
                             # Format: "163,10" -> "163,10 €"
-                            listing_data["extra_costs"] = f"{extra_costs_value} €"
-                        
+                            listing_data["extra_costs"] = f"{snapshot['extraCosts']} €"
                         
                         # Extract imagePath or imageUrl from main snapshot
-                        # Try imagePath first (in item data)
-                        image_match = re.search(r'"imagePath"\s*:\s*"([^"]+)"', snapshot_attr)
-                        if not image_match:
-                            # Try imageUrl as fallback
-                            image_match = re.search(r'"imageUrl"\s*:\s*"([^"]+)"', snapshot_attr)
-                        
-                        if image_match:
-                            image_path = image_match.group(1).replace('\\/', '/')
+                        # Try imagePath first (in item data), imageUrl as fallback
+                        image_path = snapshot.get("imagePath") or snapshot.get("imageUrl")
+                        if image_path:
                             # Convert relative path to full URL
                             if image_path.startswith('images/'):
                                 listing_data["image_url"] = f"https://www.inberlinwohnen.de/img/{image_path}"
@@ -625,81 +1055,38 @@ def extract_listings(driver):
                         
                         # If image not found in main snapshot, try child image component
                         if not listing_data["image_url"]:
-                            try:
-                                # Look for image component by class or wire:id pattern
-                                image_divs = parent_div.find_elements(By.XPATH, 
-                                    ".//div[contains(@wire:id, 'image') or contains(@class, 'image')]")
-                                for img_div in image_divs:
-                                    img_snapshot = img_div.get_attribute("wire:snapshot")
-                                    if img_snapshot:
-                                        img_match = re.search(r'"imageUrl"\s*:\s*"([^"]+)"', img_snapshot)
-                                        if img_match:
-                                            image_path = img_match.group(1).replace('\\/', '/')
-                                            if image_path.startswith('images/'):
-                                                listing_data["image_url"] = f"https://www.inberlinwohnen.de/img/{image_path}"
-                                            elif not image_path.startswith('http'):
-                                                listing_data["image_url"] = f"https://www.inberlinwohnen.de/img/{image_path}"
-                                            else:
-                                                listing_data["image_url"] = image_path
-                                            break
-                            except Exception as e:
-                                print(f"    ⚠ Error finding image component: {e}")
-                                pass
+                            for img_snapshot in raw["imageSnapshots"]:
+                                image_path = _parse_snapshot(img_snapshot).get("imageUrl")
+                                if image_path:
+                                    if image_path.startswith('images/'):
+                                        listing_data["image_url"] = f"https://www.inberlinwohnen.de/img/{image_path}"
+                                    elif not image_path.startswith('http'):
+                                        listing_data["image_url"] = f"https://www.inberlinwohnen.de/img/{image_path}"
+                                    else:
+                                        listing_data["image_url"] = image_path
+                                    break
                         
-                        # Extract WBS from details array in snapshot
-                        # Look for {"label":"WBS",...,"value":"..."} pattern in the details array
-                        # The pattern is: "label":"WBS" followed by "value":"..." somewhere after
-                        wbs_match = re.search(r'"label"\s*:\s*"WBS"[^}]*?"value"\s*:\s*"([^"]+)"', snapshot_attr)
-                        if not wbs_match:
-                            # Try alternative pattern - WBS value might be in a different format
-                            wbs_match = re.search(r'"WBS"[^}]*?"value"\s*:\s*"([^"]+)"', snapshot_attr)
-                        if wbs_match:
-                            wbs_value = wbs_match.group(1)
-                            # Decode common escape sequences
-                            wbs_value = (wbs_value.replace('\\u00e4', 'ä')
-                                        .replace('\\u00f6', 'ö')
-                                        .replace('\\u00fc', 'ü')
-                                        .replace('\\u00c4', 'Ä')
-                                        .replace('\\u00d6', 'Ö')
-                                        .replace('\\u00dc', 'Ü')
-                                        .replace('\\u00df', 'ß'))
-                            listing_data["wbs"] = wbs_value
+                        # WBS from the details array ({"label":"WBS",...,"value":"..."});
+                        # unicode escapes are already decoded by the JSON parser
+                        if "wbs" in snapshot:
+                            listing_data["wbs"] = snapshot["wbs"]
                         
                 except Exception as e:
-                    print(f"    ⚠ Error extracting from snapshot: {e}")
+                    log.warning(f"    ⚠ Error extracting from snapshot: {e}")
                     pass
                 
-                # If snapshot didn't work, try finding elements directly
-                if not listing_data["url"]:
-                    try:
-                        deeplink_links = parent_div.find_elements(By.XPATH, 
-                            ".//a[contains(@href, 'degewo') or contains(@href, 'gesobau') or contains(@href, 'gewobag') or contains(@href, 'howoge') or contains(@href, 'stadtundland') or contains(@href, 'wbm')]")
-                        if deeplink_links:
-                            listing_data["url"] = deeplink_links[0].get_attribute("href")
-                    except Exception:
-                        pass
+                # If snapshot didn't work, use links to the housing companies
+                if not listing_data["url"] and raw["deeplinks"]:
+                    listing_data["url"] = raw["deeplinks"][0]
                 
-                # Extract additional details from the details section
-                # These are in <dt> and <dd> elements
-                try:
-                    # Find all detail rows
-                    detail_rows = parent_div.find_elements(By.XPATH, ".//dl[@class='grid grid-cols-2']//dt")
-                    for dt in detail_rows:
-                        label = dt.text.strip()
-                        try:
-                            dd = dt.find_element(By.XPATH, "./following-sibling::dd[1]")
-                            value = dd.text.strip()
-                            
-                            if "Nebenkosten" in label:
-                                # Only set extra_costs if not already set
-                                if not listing_data.get("extra_costs"):
-                                    listing_data["extra_costs"] = value
-                            elif "WBS" in label:
-                                listing_data["wbs"] = value
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
+                # Additional details from the <dt>/<dd> details section
+                for label, value in raw["details"]:
+                    if "Nebenkosten" in label:
+                        # Only set extra_costs if not already set
+                        if not listing_data.get("extra_costs"):
+                            listing_data["extra_costs"] = value
+                    elif "WBS" in label:
+                        listing_data["wbs"] = value
                 
                 # Calculate brutto miete kalt (kaltmiete + nebenkosten kalt)
                 try:
@@ -712,30 +1099,19 @@ def extract_listings(driver):
                     pass
                 
                 # Extract title from aria-label if available
-                aria_label = button.get_attribute("aria-label")
-                if aria_label:
-                    # aria-label format: "Wohnungsangebot - 3,0 Zimmer, 86,76 m², 837,93 € Kaltmiete | Address"
-                    # Try to extract a meaningful title
-                    if "Wohnungsangebot" in aria_label:
-                        # Use the address as title if we don't have a better one
-                        if listing_data["address"]:
-                            listing_data["title"] = listing_data["address"]
-                        else:
-                            listing_data["title"] = text.split('|')[0].strip()[:200] if '|' in text else text[:200]
-                    else:
-                        listing_data["title"] = aria_label[:200]
+                aria_label = raw["ariaLabel"]
+                # aria-label format: "Wohnungsangebot - 3,0 Zimmer, 86,76 m², 837,93 € Kaltmiete | Address"
+                # The generic "Wohnungsangebot" label isn't a meaningful title
+                if aria_label and "Wohnungsangebot" not in aria_label:
+                    listing_data["title"] = aria_label[:200]
                 else:
-                    # Use address or first part of text as title
-                    if listing_data["address"]:
-                        listing_data["title"] = listing_data["address"]
-                    elif '|' in text:
-                        listing_data["title"] = text.split('|')[0].strip()[:200]
-                    else:
-                        listing_data["title"] = text[:200]
+                    listing_data["title"] = _title_from(text, listing_data["address"])
                 
                 # Only add if we have some identifying information
                 if listing_data["url"] or (listing_data["address"] and len(listing_data["address"]) > 5):
                     listings.append(listing_data)
+                    if not log.isEnabledFor(logging.DEBUG):
+                        continue
                     debug_info = []
                     if listing_data.get('extra_costs'):
                         debug_info.append(f"Nebenkosten: {listing_data['extra_costs']}")
@@ -746,26 +1122,77 @@ def extract_listings(driver):
                     else:
                         debug_info.append("Image: ✗")
                     debug_str = f" ({', '.join(debug_info)})" if debug_info else ""
-                    print(f"  ✓ Listing {idx+1}: {listing_data.get('rooms', '?')} Zimmer, {listing_data.get('area', '?')} m², {listing_data.get('price', '?')} € - {listing_data.get('address', 'No address')[:50]}{debug_str}")
+                    log.debug(
+                        "  ✓ Listing %d: %s Zimmer, %s m², %s € - %s%s",
+                        idx + 1, listing_data.get('rooms', '?'), listing_data.get('area', '?'),
+                        listing_data.get('price', '?'), listing_data.get('address', 'No address')[:50], debug_str
+                    )
                 else:
-                    print(f"  ⚠ Skipping listing {idx+1} - no identifying information")
+                    log.warning(f"  ⚠ Skipping listing {idx+1} - no identifying information")
                     
             except Exception as e:
-                print(f"  ⚠ Error extracting listing {idx+1}: {e}")
-                import traceback
-                traceback.print_exc()
+                log.warning(f"  ⚠ Error extracting listing {idx+1}: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
                 continue
         
-        print(f"\n✓ Successfully extracted {len(listings)} valid listings")
+        if skipped_known:
+            log.debug(f"  ✓ Skipped details of {skipped_known} already known listings")
+        log.info(f"✓ Extracted {len(listings)} valid listings")
         return listings
         
     except Exception as e:
-        print(f"✗ Error extracting listings: {e}")
-        import traceback
-        traceback.print_exc()
+        log.error(f"✗ Error extracting listings: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
         return []
 
 
+def _get_db():
+    """
+    Return the shared connection to the listings database, opening it on first use.
+    
+    The scraper runs one scrape at a time, so a single long-lived connection
+    replaces a connect/close per database call and keeps its prepared
+    statement cache warm. It is closed by close_database(), which also runs
+    at interpreter exit.
+    
+    The database is switched to WAL mode by init_database() (that setting is
+    persistent). The per-connection settings applied here relax fsyncs to
+    WAL checkpoints (synchronous=NORMAL, still crash safe in WAL mode), keep
+    temporary tables in memory and enlarge the page cache and mmap window.
+    
+    Returns:
+        sqlite3.Connection: Open connection to config.DATABASE_PATH.
+    """
+    global _db
+    
+    with _db_lock:
+        if _db is None:
+            conn = sqlite3.connect(config.DATABASE_PATH, check_same_thread=False, cached_statements=128)
+            conn.executescript("""
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-20000;
+                PRAGMA mmap_size=268435456;
+            """)
+            _db = conn
+        return _db
+
+
+def close_database():
+    """
+    Close the shared database connection, if one is open.
+    
+    Called at interpreter exit; the next database call reopens it.
+    """
+    global _db
+    
+    with _db_lock:
+        if _db is not None:
+            _db.close()
+            _db = None
+
+
+atexit.register(close_database)
+
+
 def init_database():
     """
     Initialize SQLite database and create listings table if it doesn't exist.
@@ -783,74 +1210,86 @@ def init_database():
     - wbs: WBS permit requirement
     - image_url: URL to apartment image
     - raw_text: Raw extracted text
-    - first_seen: ISO timestamp of first discovery
-    - last_seen: ISO timestamp of last seen
+    - first_seen: Unix timestamp (seconds) of first discovery
+    - last_seen: Unix timestamp (seconds) of last seen
     - notified: Boolean flag for notification status
     
-    The function also handles schema migrations by adding new columns
-    (extra_costs, wbs, image_url) if they don't exist, allowing the database
-    to be upgraded without losing existing data.
+    The function also handles schema migrations, allowing the database to be
+    upgraded without losing existing data:
+    - 1: adds new columns (extra_costs, wbs, image_url, brutto_miete_kalt)
+      if they don't exist
+    - 2: converts first_seen/last_seen from ISO strings to Unix timestamps
+    The schema version is stored in PRAGMA user_version so migrations only
+    run once.
     
     Database path is configured in config.DATABASE_PATH (default: "apartments.db").
     
     Note:
-        - Safe to call multiple times (uses CREATE TABLE IF NOT EXISTS)
+        - Switches the database to WAL journal mode
+        - Safe to call multiple times (only creates the table if missing)
         - Handles existing databases gracefully
         - Prints confirmation message on success
     """
-    conn = sqlite3.connect(config.DATABASE_PATH)
+    conn = _get_db()
+    # Write-ahead logging: no rollback-journal double write and readers
+    # don't block the writer. Persistent, so it only needs to be set once.
+    conn.execute("PRAGMA journal_mode=WAL")
     cursor = conn.cursor()
     
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS listings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            url TEXT UNIQUE,
-            title TEXT,
-            address TEXT,
-            price TEXT,
-            rooms TEXT,
-            area TEXT,
-            extra_costs TEXT,
-            brutto_miete_kalt TEXT,
-            wbs TEXT,
-            image_url TEXT,
-            raw_text TEXT,
-            first_seen TEXT,
-            last_seen TEXT,
-            notified INTEGER DEFAULT 0
-        )
-    """)
-    
-    # Add new columns if they don't exist (for existing databases)
-    try:
-        cursor.execute("ALTER TABLE listings ADD COLUMN extra_costs TEXT")
-    except Exception:
-        pass
-    try:
-        cursor.execute("ALTER TABLE listings ADD COLUMN wbs TEXT")
-    except Exception:
-        pass
-    try:
-        cursor.execute("ALTER TABLE listings ADD COLUMN image_url TEXT")
-    except Exception:
-        pass
-    try:
-        cursor.execute("ALTER TABLE listings ADD COLUMN brutto_miete_kalt TEXT")
-    except Exception:
-        pass
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'listings'")
+    if cursor.fetchone() is None:
+        # New database: create the current schema, nothing to migrate
+        cursor.execute(_CREATE_LISTINGS_SQL.format(table="listings"))
+        cursor.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+    
+    # Migrate existing databases. PRAGMA user_version records which
+    # migrations already ran, so they are skipped on every later start.
+    cursor.execute("PRAGMA user_version")
+    version = cursor.fetchone()[0]
+    
+    if version < 1:
+        # Add columns introduced after the first release
+        cursor.execute("PRAGMA table_info(listings)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for column in ("extra_costs", "wbs", "image_url", "brutto_miete_kalt"):
+            if column not in existing_columns:
+                cursor.execute(f"ALTER TABLE listings ADD COLUMN {column} TEXT")
+        cursor.execute("PRAGMA user_version=1")
+    
+    if version < 2:
+        # first_seen/last_seen: ISO strings (local time) -> INTEGER Unix
+        # timestamps. The column type can't be altered in place (TEXT
+        # affinity would store the integers as text), so rebuild the table.
+        cursor.execute("BEGIN")
+        cursor.execute(_CREATE_LISTINGS_SQL.format(table="listings_new"))
+        cursor.execute("""
+            INSERT INTO listings_new (id, url, title, address, price, rooms, area, extra_costs, brutto_miete_kalt, wbs, image_url, raw_text, first_seen, last_seen, notified)
+            SELECT id, url, title, address, price, rooms, area, extra_costs, brutto_miete_kalt, wbs, image_url, raw_text,
+                   CAST(strftime('%s', first_seen, 'utc') AS INTEGER),
+                   CAST(strftime('%s', last_seen, 'utc') AS INTEGER),
+                   notified
+            FROM listings
+        """)
+        cursor.execute("DROP TABLE listings")
+        cursor.execute("ALTER TABLE listings_new RENAME TO listings")
+        cursor.execute("PRAGMA user_version=2")
+        conn.commit()
     
     conn.commit()
-    conn.close()
-    print("✓ Database initialized")
+    log.info("✓ Database initialized")
 
 
-def get_seen_listing_urls():
+def get_seen_listing_urls(conn=None):
     """
     Retrieve all listing URLs that have been seen before from the database.
     
     This function queries the database to get a set of all URLs that have
-    been previously stored. This is used to detect new listings and avoid
-    duplicates.
+    been previously stored. This is a full table scan; to check a batch of
+    listings use get_known_listing_urls() instead.
+    
+    Args:
+        conn (sqlite3.Connection, optional): Connection to use.
+            Defaults to None (the shared connection from _get_db()).
     
     Returns:
         set[str]: Set of URLs (strings) that have been seen before.
@@ -858,16 +1297,47 @@ def get_seen_listing_urls():
     
     Note:
         - Only returns listings with non-null URLs
-        - Used internally by save_listings() to detect new listings
     """
-    conn = sqlite3.connect(config.DATABASE_PATH)
+    if conn is None:
+        conn = _get_db()
     cursor = conn.cursor()
+    cursor.arraysize = 1000
     cursor.execute("SELECT url FROM listings WHERE url IS NOT NULL")
-    seen_urls = {row[0] for row in cursor.fetchall()}
-    conn.close()
+    # Iterate the cursor directly instead of materializing fetchall()
+    seen_urls = {row[0] for row in cursor}
     return seen_urls
 
 
+def get_known_listing_urls(urls, conn=None):
+    """
+    Return which of the given URLs are already stored in the database.
+    
+    Unlike get_seen_listing_urls(), this only looks up the given URLs (one
+    query with an IN clause) instead of loading every URL ever seen.
+    
+    Args:
+        urls (list[str]): Listing URLs (deeplinks) to look up.
+        conn (sqlite3.Connection, optional): Connection to use.
+            Defaults to None (the shared connection from _get_db()).
+    
+    Returns:
+        set[str]: The subset of ``urls`` that exist in the database.
+    
+    Note:
+        - Used by save_listings() to detect new listings
+    """
+    if not urls:
+        return set()
+    
+    if conn is None:
+        conn = _get_db()
+    cursor = conn.cursor()
+    placeholders = ",".join("?" * len(urls))
+    cursor.execute(f"SELECT url FROM listings WHERE url IN ({placeholders})", list(urls))
+    known_urls = {row[0] for row in cursor}
+    return known_urls
+
+
 def get_newest_listing():
     """
     Retrieve the newest listing from the database (by first_seen timestamp).
@@ -876,7 +1346,7 @@ def get_newest_listing():
         dict: Dictionary containing listing data, or None if no listings exist.
             The dictionary has the same structure as listings returned by extract_listings().
     """
-    conn = sqlite3.connect(config.DATABASE_PATH)
+    conn = _get_db()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -888,7 +1358,6 @@ def get_newest_listing():
     """)
     
     row = cursor.fetchone()
-    conn.close()
     
     if not row:
         return None
@@ -960,53 +1429,13 @@ def translate_wbs_value(wbs_value):
     return wbs_value
 
 
-def send_listing_notification(listing, is_test=False):
-    """
-    Send a notification for a single listing.
-    
-    Args:
-        listing (dict): Listing dictionary with apartment details
-        is_test (bool, optional): If True, marks the notification as a test.
-            Defaults to False.
-    
-    Returns:
-        bool: True if notification was sent successfully, False otherwise.
-    """
-    try:
-        url = listing.get("url", "No URL")
-        title = listing.get("title", listing.get("address", "New listing"))[:100]
-        address = listing.get("address", "N/A")
-        rooms = listing.get("rooms", "N/A")
-        area = listing.get("area", "N/A")
-        price = listing.get("price", "N/A")
-        extra_costs = listing.get("extra_costs", "N/A")
-        brutto_miete_kalt = listing.get("brutto_miete_kalt", "N/A")
-        wbs_raw = listing.get("wbs", "N/A")
-        wbs = translate_wbs_value(wbs_raw)  # Translate for display
-        image_url = listing.get("image_url", "").strip()
-        
-        # Validate image URL
-        if image_url and not (image_url.startswith("http://") or image_url.startswith("https://")):
-            print(f"  ⚠ Invalid image URL format: {image_url[:50]}")
-            image_url = ""
-        
-        # Generate Google Maps URL for the address
-        maps_url = get_google_maps_url(address)
-        
-        # Create plain text message
-        test_prefix = "[TEST] " if is_test else ""
-        message = f"""{test_prefix} {title}
+_LISTING_TEXT_TEMPLATE = """{test_prefix} {title}
 {rooms} rooms / {area} m² / {brutto_miete_kalt}
 WBS permit: {wbs}
 """
-        
-        # Create HTML message with clickable address link
-        address_html = f'<a href="{maps_url}" style="color: #1976D2; text-decoration: underline;">{address}</a>' if maps_url else address
-        
-        html_message = f"""<html>
-<head></head>
-<body>
-    <h3>{test_prefix}{title} - {brutto_miete_kalt}</h3>
+"""Plain text notification for one listing (see build_listing_messages)."""
+
+_LISTING_HTML_TEMPLATE = """    <h3>{test_prefix}{title} - {brutto_miete_kalt}</h3>
     <p><strong>Address:</strong> {address_html}</p>
     <table style="border-collapse: collapse; margin: 20px 0;">
         <tr>
@@ -1035,22 +1464,128 @@ WBS permit: {wbs}
         </tr>
     </table>
     
-    {f'<p><img src="{image_url}" alt="Apartment image" style="max-width: 600px; border: 1px solid #ddd; border-radius: 4px;"></p>' if (image_url and len(image_url) > 10 and image_url.startswith("http")) else ''}
+    {image_html}
     
-    <p><a href="{url}" style="background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px; display: inline-block;">View Details</a></p>
-</body>
-</html>"""
-        
-        # Debug: Print image URL if present
-        if image_url:
-            print(f"  Image URL: {image_url}")
-        
-        send_notification(message, html_message=html_message, image_url=image_url)
+    <p><a href="{url}" style="background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px; display: inline-block;">View Details</a></p>"""
+"""HTML email fragment for one listing (see build_listing_messages)."""
+
+_ADDRESS_LINK_HTML = '<a href="{maps_url}" style="color: #1976D2; text-decoration: underline;">{address}</a>'
+"""Address linked to Google Maps, used in _LISTING_HTML_TEMPLATE."""
+
+_LISTING_IMAGE_HTML = '<p><img src="{image_url}" alt="Apartment image" style="max-width: 600px; border: 1px solid #ddd; border-radius: 4px;"></p>'
+"""Apartment image, used in _LISTING_HTML_TEMPLATE if the listing has one."""
+
+
+def build_listing_messages(listing, is_test=False):
+    """
+    Build the plain text and HTML notification content for a single listing.
+    
+    Args:
+        listing (dict): Listing dictionary with apartment details
+        is_test (bool, optional): If True, marks the notification as a test.
+            Defaults to False.
+    
+    Returns:
+        dict: Notification content with keys:
+            - message (str): Plain text message
+            - html_body (str): HTML fragment for the email body (wrap with
+              notifications.wrap_html_document() for a standalone email)
+            - image_url (str): Validated image URL, or empty string
+    """
+    url = listing.get("url", "No URL")
+    title = listing.get("title", listing.get("address", "New listing"))[:100]
+    address = listing.get("address", "N/A")
+    rooms = listing.get("rooms", "N/A")
+    area = listing.get("area", "N/A")
+    price = listing.get("price", "N/A")
+    extra_costs = listing.get("extra_costs", "N/A")
+    brutto_miete_kalt = listing.get("brutto_miete_kalt", "N/A")
+    wbs_raw = listing.get("wbs", "N/A")
+    wbs = translate_wbs_value(wbs_raw)  # Translate for display
+    image_url = listing.get("image_url", "").strip()
+    
+    # Validate image URL once; both the text and HTML paths rely on this
+    if image_url and not (image_url.startswith(("http://", "https://")) and len(image_url) > 10):
+        log.warning(f"  ⚠ Invalid image URL format: {image_url[:50]}")
+        image_url = ""
+    
+    # Generate Google Maps URL for the address
+    maps_url = get_google_maps_url(address)
+    
+    fields = {
+        "test_prefix": "[TEST] " if is_test else "",
+        "title": title,
+        "url": url,
+        "address": address,
+        "rooms": rooms,
+        "area": area,
+        "price": price,
+        "extra_costs": extra_costs,
+        "brutto_miete_kalt": brutto_miete_kalt,
+        "wbs": wbs,
+        "image_url": image_url,
+        "maps_url": maps_url,
+    }
+    
+    # Create plain text message
+    message = _LISTING_TEXT_TEMPLATE.format_map(fields)
+    
+    # Create HTML message with clickable address link
+    fields["address_html"] = _ADDRESS_LINK_HTML.format_map(fields) if maps_url else address
+    fields["image_html"] = _LISTING_IMAGE_HTML.format_map(fields) if image_url else ""
+    html_body = _LISTING_HTML_TEMPLATE.format_map(fields)
+    
+    # Debug: Print image URL if present
+    if image_url:
+        log.debug(f"  Image URL: {image_url}")
+    
+    return {"message": message, "html_body": html_body, "image_url": image_url}
+
+
+def send_listing_notification(listing, is_test=False):
+    """
+    Send a notification for a single listing.
+    
+    Args:
+        listing (dict): Listing dictionary with apartment details
+        is_test (bool, optional): If True, marks the notification as a test.
+            Defaults to False.
+    
+    Returns:
+        bool: True if notification was sent successfully, False otherwise.
+    """
+    try:
+        content = build_listing_messages(listing, is_test=is_test)
+        send_notification(
+            content["message"],
+            html_message=wrap_html_document(content["html_body"]),
+            image_url=content["image_url"]
+        )
         return True
     except Exception as e:
-        print(f"  ✗ Error sending notification: {e}")
-        import traceback
-        traceback.print_exc()
+        log.error(f"  ✗ Error sending notification: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
+        return False
+
+
+def send_new_listings_notification(listings):
+    """
+    Send one combined notification for all new listings of a scrape.
+    
+    Builds the content for every listing and hands it to
+    send_notification_batch(), so a burst of new listings results in a
+    single email or ntfy message instead of one per listing.
+    
+    Args:
+        listings (list[dict]): New listings as returned by save_listings()
+    
+    Returns:
+        bool: True if the notification was sent successfully, False otherwise.
+    """
+    try:
+        items = [build_listing_messages(listing) for listing in listings]
+        return send_notification_batch(items)
+    except Exception as e:
+        log.error(f"  ✗ Error sending notification: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
         return False
 
 
@@ -1064,24 +1599,24 @@ def send_test_email():
     Returns:
         bool: True if test email was sent successfully, False otherwise.
     """
-    print("\n=== SENDING TEST EMAIL ===\n")
+    log.info("=== SENDING TEST EMAIL ===")
     
     listing = get_newest_listing()
     
     if not listing:
-        print("✗ No listings found in database. Please run the scraper first to populate the database.")
+        log.error("✗ No listings found in database. Please run the scraper first to populate the database.")
         return False
     
-    print(f"✓ Found newest listing: {listing.get('address', 'N/A')}")
-    print(f"  {listing.get('rooms', '?')} rooms, {listing.get('area', '?')} m², {listing.get('price', '?')} €")
-    print("\nSending test email notification...")
+    log.info(f"✓ Found newest listing: {listing.get('address', 'N/A')}")
+    log.info(f"  {listing.get('rooms', '?')} rooms, {listing.get('area', '?')} m², {listing.get('price', '?')} €")
+    log.info("Sending test email notification...")
     
     success = send_listing_notification(listing, is_test=True)
     
     if success:
-        print("✓ Test email sent successfully!")
+        log.info("✓ Test email sent successfully!")
     else:
-        print("✗ Failed to send test email")
+        log.error("✗ Failed to send test email")
     
     return success
 
@@ -1107,50 +1642,72 @@ def save_listings(listings):
     
     Note:
         - Uses URL as primary identifier for duplicate detection
-        - Falls back to raw_text[:100] if URL is not available
+        - Falls back to raw_text[:100] if URL is not available; that
+          identifier is stored in the url column so it is recognized
+          on the next scrape
+        - Looks up only this batch's URLs to split new from known listings
+        - All inserts and updates are written in one transaction
         - Updates last_seen timestamp for existing listings
         - Sets first_seen and last_seen to current timestamp for new listings
+        - Inserts only the new listings, with one executemany(); a URL that
+          already exists is left untouched (ON CONFLICT DO NOTHING)
+        - Updates last_seen of known ones with one executemany() UPDATE
+          keyed on the url index
     """
-    conn = sqlite3.connect(config.DATABASE_PATH)
-    cursor = conn.cursor()
+    # Use raw_text as identifier if no URL
+    keys = [listing.get("url") or listing.get("raw_text", "")[:100] for listing in listings]
     
-    seen_urls = get_seen_listing_urls()
+    # Only this batch's URLs are looked up instead of scanning every URL ever seen
+    conn = _get_db()
+    seen_urls = get_known_listing_urls(list(set(keys)), conn)
     new_listings = []
-    now = datetime.now().isoformat()
-    
-    for listing in listings:
-        url = listing.get("url", "")
-        if not url:
-            # Use raw_text as identifier if no URL
-            url = listing.get("raw_text", "")[:100]
+    new_rows = []
+    seen_keys = set()
+    now = int(time.time())
+    
+    for listing, url in zip(listings, keys):
+        if url in seen_urls:
+            seen_keys.add(url)
+            continue
         
-        if url not in seen_urls:
-            # New listing
-            cursor.execute("""
-                INSERT INTO listings (url, title, address, price, rooms, area, extra_costs, brutto_miete_kalt, wbs, image_url, raw_text, first_seen, last_seen)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                listing.get("url"),
-                listing.get("title", ""),
-                listing.get("address", ""),
-                listing.get("price", ""),
-                listing.get("rooms", ""),
-                listing.get("area", ""),
-                listing.get("extra_costs", ""),
-                listing.get("brutto_miete_kalt", ""),
-                listing.get("wbs", ""),
-                listing.get("image_url", ""),
-                listing.get("raw_text", ""),
-                now,
-                now
-            ))
-            new_listings.append(listing)
-        else:
-            # Update last_seen
-            cursor.execute("UPDATE listings SET last_seen = ? WHERE url = ?", (now, url))
-    
-    conn.commit()
-    conn.close()
+        # New listing
+        get = listing.get
+        new_rows.append((
+            url,
+            get("title", ""),
+            get("address", ""),
+            get("price", ""),
+            get("rooms", ""),
+            get("area", ""),
+            get("extra_costs", ""),
+            get("brutto_miete_kalt", ""),
+            get("wbs", ""),
+            get("image_url", ""),
+            get("raw_text", ""),
+            now,
+            now
+        ))
+        new_listings.append(listing)
+        # Guard against the same listing appearing twice in one scrape
+        seen_urls.add(url)
+    
+    # Write everything in a single transaction (one commit/fsync per scrape)
+    with conn:
+        # Insert new listings. They were checked against the database above;
+        # DO NOTHING only guards against a row added concurrently (e.g. by
+        # a second tracker on the same database file)
+        conn.executemany("""
+            INSERT INTO listings (url, title, address, price, rooms, area, extra_costs, brutto_miete_kalt, wbs, image_url, raw_text, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO NOTHING
+        """, new_rows)
+        
+        # Update last_seen of all known listings: one prepared statement,
+        # each row found through the UNIQUE index on url
+        conn.executemany(
+            "UPDATE listings SET last_seen = ? WHERE url = ?",
+            [(now, url) for url in seen_keys]
+        )
     
     return new_listings
 
@@ -1160,18 +1717,21 @@ def scrape_apartments():
     Main scraping function that orchestrates the entire scraping process.
     
     This is the primary entry point for scraping apartment listings. It:
-    1. Initializes the browser and navigates to the website
-    2. Accepts privacy settings
+    1. Gets the shared browser and navigates to the website
+    2. Accepts privacy settings (once per browser session)
     3. Opens search filters
     4. Sets search criteria from config.py
+       (steps 2-4 are skipped when the filtered results URL from a previous
+       scrape can simply be reloaded)
     5. Extracts listings from results
     6. Saves listings to database
     7. Sends notifications for new listings
     8. Returns count of new listings found
     
     The function includes random delays between steps to appear more human-like
-    and avoid detection. It handles errors gracefully and always cleans up the
-    browser driver, even if an error occurs.
+    and avoid detection. It handles errors gracefully. The browser is kept
+    open for the next scrape, but closed after an error so the next scrape
+    starts with a fresh one.
     
     Returns:
         int: Number of new listings found (0 if none found or error occurred)
@@ -1187,41 +1747,60 @@ def scrape_apartments():
         ...     print(f"Found {new_count} new apartments!")
     
     Note:
-        - Always closes browser driver in finally block
+        - Reuses the browser across calls (see get_driver/close_driver)
         - Returns 0 on any error (doesn't raise exceptions)
         - Includes random delays for natural behavior
     """
-    print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting apartment scrape...")
+    global _privacy_accepted, _results_url
+    
+    log.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting apartment scrape...")
     
-    driver = None
     try:
-        driver = init_driver()
-        driver.get(config.BASE_URL)
+        driver = get_driver()
         
-        # Wait for page to load (with small randomness)
-        time.sleep(3 + random.uniform(0, 2))
-        
-        # Accept privacy settings
-        accept_privacy_settings(driver)
-        
-        # Open search filters
-        if not open_search_filters(driver):
-            print("✗ Failed to open search filters")
-            return 0
-        
-        # Set search criteria
-        if not set_search_criteria(driver):
-            print("✗ Failed to set search criteria")
-            return 0
-        
-        # Wait a bit more for results to fully load (with small randomness)
-        print("\nWaiting for search results to fully load...")
-        time.sleep(3 + random.uniform(0, 2))
+        if _results_url:
+            # Filters are part of the results URL: just reload it
+            log.debug("Reloading filtered results page...")
+            # The previous results are still loaded: wait until that counter
+            # is gone, so the counter found next belongs to the new page
+            wait = WebDriverWait(driver, 15, poll_frequency=_RESULTS_POLL_FREQUENCY)
+            old_counter = driver.find_elements(By.XPATH, "//span[contains(text(), 'Wohnungen')]")
+            driver.get(_results_url)
+            if old_counter:
+                try:
+                    wait.until(EC.staleness_of(old_counter[0]))
+                except TimeoutException:
+                    log.warning("⚠ Previous results still shown, continuing anyway...")
+            _wait_for_results(wait)
+        else:
+            driver.get(config.BASE_URL)
+            
+            # Wait for page to load (with small randomness)
+            time.sleep(3 + random.uniform(0, 2))
+            
+            # Accept privacy settings (only once per browser session)
+            if not _privacy_accepted:
+                _privacy_accepted = accept_privacy_settings(driver)
+            
+            # Open search filters
+            if not open_search_filters(driver):
+                log.error("✗ Failed to open search filters")
+                return 0
+            
+            # Set search criteria
+            if not set_search_criteria(driver):
+                log.error("✗ Failed to set search criteria")
+                return 0
+            
+            # Remember the results URL if it carries the search parameters,
+            # so the next scrape can skip the filter form
+            if _url_has_search_criteria(driver.current_url):
+                _results_url = driver.current_url
         
         # Extract listings
-        print("\nCalling extract_listings...")
-        listings = extract_listings(driver)
-        print(f"extract_listings returned {len(listings) if listings else 0} listings")
+        log.debug("Calling extract_listings...")
+        listings = extract_listings(driver, skip_known=True)
+        log.debug(f"extract_listings returned {len(listings) if listings else 0} listings")
         
         new_listings_count = 0
         if listings:
@@ -1231,7 +1810,7 @@ def scrape_apartments():
             new_listings_count = len(new_listings) if new_listings else 0
             
             if new_listings:
-                print(f"🎉 Found {new_listings_count} new listing(s)!")
+                log.info(f"🎉 Found {new_listings_count} new listing(s)!")
                 
                 # Send a summary system notification
                 if new_listings_count == 1:
@@ -1240,37 +1819,56 @@ def scrape_apartments():
                 else:
                     summary = f"Found {new_listings_count} new apartments!"
                 
-                from notifications import send_system_notification
-                send_system_notification(
-                    title="🏠 New Apartment Found!",
-                    message=summary,
-                    sound=True
-                )
-                
-                for listing in new_listings:
-                    send_listing_notification(listing, is_test=False)
+                # The email/ntfy send is network-bound; run it in a worker
+                # thread while the system notification is posted from this
+                # thread (Cocoa/osascript), so the two don't add up
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    remote = pool.submit(send_new_listings_notification, new_listings)
+                    send_system_notification(
+                        title="🏠 New Apartment Found!",
+                        message=summary,
+                        sound=True
+                    )
+                    remote.result()
             else:
-                print("✓ No new listings found")
+                log.info("✓ No new listings found")
         else:
-            print("⚠ No listings extracted")
+            log.warning("⚠ No listings extracted")
             new_listings_count = 0
         
         # Return the count of new listings found
         return new_listings_count
         
     except Exception as e:
-        print(f"✗ Error during scraping: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"✗ Error during scraping: {e}")
+        # The browser may be in an unknown state - start fresh next time
+        close_driver()
         return 0
     
     finally:
-        if driver:
-            driver.quit()
-        print("✓ Scraping completed\n")
+        log.info("✓ Scraping completed")
+
+
+def configure_logging():
+    """
+    Send log output to the console.
+    
+    Uses the INFO level, or DEBUG if config.DEBUG_SCRAPER is set (which also
+    shows per-step and per-listing details). Messages are printed without
+    extra decoration, like the rest of the console output.
+    
+    Note:
+        Call this once from the entry point (main.py or a script); importing
+        the module does not configure logging.
+    """
+    logging.basicConfig(
+        level=logging.DEBUG if config.DEBUG_SCRAPER else logging.INFO,
+        format="%(message)s"
+    )
 
 
 if __name__ == "__main__":
+    configure_logging()
     init_database()
     scrape_apartments()
 
@@ -16,8 +16,13 @@ Use this script when:
 - Testing new extraction logic
 
 Example:
-    Run the test script:
-    >>> python test_scraper.py
+    Run the test script and keep the browser open until Enter is pressed:
+    >>> python test_scraper.py --interactive
+    
+    Run without a browser window (e.g. for regression runs); several runs
+    with different rent limits can be started in parallel, each uses its
+    own browser profile and test_page_source_<rent>.html:
+    >>> python test_scraper.py --headless --rent-max 500
     
     The script will:
     1. Open browser and navigate to the website
@@ -25,24 +30,130 @@ Example:
     3. Try to accept privacy settings
     4. Try to open filters
     5. Try to set search criteria and submit
-    6. Try to extract listings
+    6. Try to extract listings and mark those not yet in the database
     7. Save page source to test_page_source.html
-    8. Wait for user input before closing
+    8. Wait for user input before closing (only with --interactive)
 """
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 import time
-from scraper import extract_listings
+import config
+from scraper import extract_listings, get_seen_listing_urls, configure_logging
+from scraper import block_resources as _block_resources  # init_driver has a block_resources flag
+
+log = logging.getLogger("test_scraper")
+
+_inspected_pages = set()
+"""(URL, page source digest) of pages inspect_page() has already reported."""
+
+_PROFILE_DIR = os.path.join(tempfile.gettempdir(), "trackapt-test-profile")
+"""Chrome profile directory reused between test runs (HTTP cache, cookies).
+Separate from config.CHROME_PROFILE_DIR, so the test can run while the
+scraper's browser is open."""
+
+_DEFAULT_RENT_MAX = 460
+"""Maximum cold rent searched for unless --rent-max is given."""
+
+_DISK_CACHE_SIZE = 512 * 1024 * 1024
+"""Size of Chrome's disk cache in the test profile, in bytes."""
+
+_PAGE_LOAD_TIMEOUT = 30
+"""Seconds driver.get() may take before it raises TimeoutException."""
+
+_SCRIPT_TIMEOUT = 15
+"""Seconds an (async) script may run before it raises TimeoutException."""
+
+_PAGE_LOAD_ATTEMPTS = 3
+"""How often load_page() tries to load a page before giving up."""
+
+_LIVEWIRE_READY_JS = """
+const lw = window.Livewire;
+if (!lw) {
+    return false;
+}
+// Livewire 3 lists its components via all(), Livewire 2 via componentsById
+const components = lw.all ? lw.all() : Object.values((lw.components || {}).componentsById || {});
+return components.length > 0;
+"""
+"""True once Livewire has started and registered the page's components, i.e.
+wire:click handlers (like the privacy button's) are active."""
+
+_DUMP_ELEMENTS_JS = """
+const [css, fields, text, limit] = arguments;
+let matches = Array.from(document.querySelectorAll(css));
+if (text) {
+    // Like XPath contains(text(), ...): only the element's own text nodes count
+    matches = matches.filter(e => Array.from(e.childNodes).some(
+        n => n.nodeType === Node.TEXT_NODE && n.textContent.includes(text)));
+}
+const elements = matches.slice(0, limit === null ? matches.length : limit).map(e => {
+    const o = {tag: e.tagName.toLowerCase()};
+    fields.forEach(f => { o[f] = e.getAttribute(f) || e[f] || ''; });
+    o.text = (e.innerText || '').slice(0, 50);
+    // offsetParent would be null for position: fixed elements like the banner
+    o.visible = !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    return o;
+});
+return {count: matches.length, elements: elements};
+"""
+"""Count the elements matching a CSS selector (optionally only those whose
+own text contains a string) and collect tag, the given attributes, text and
+visibility of the first ones in the browser, so inspecting them takes a
+single WebDriver call."""
 
-def init_driver():
+_SET_FIELDS_JS = """
+const missing = [];
+for (const [name, value] of arguments[0]) {
+    const field = document.querySelector(`[name="${name}"]`);
+    if (!field) {
+        missing.push(name);
+        continue;
+    }
+    field.value = value;
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return missing;
+"""
+"""Set form fields given as [name, value] pairs and dispatch the events
+Livewire listens for, instead of typing each value key by key. Returns the
+names of fields that were not found."""
+
+def init_driver(headless=False, block_resources=True, profile_dir=_PROFILE_DIR):
     """
-    Initialize Chrome WebDriver for testing (non-headless).
+    Initialize Chrome WebDriver for testing.
+    
+    Creates a Chrome driver with options to avoid detection. By default it
+    runs in visible mode so you can see what's happening; in headless mode
+    it also uses the "eager" page load strategy, so driver.get() returns
+    once the DOM is ready instead of waiting for images and other
+    subresources.
+    
+    Like the scraper's driver it does not download images, web fonts and
+    analytics scripts (see scraper.block_resources) unless
+    block_resources is False, e.g. to look at the page as a user sees it.
     
-    Creates a Chrome driver with options to avoid detection, but runs
-    in visible mode (not headless) so you can see what's happening.
+    The profile in profile_dir is kept between runs, so cached resources and
+    the accepted privacy settings are reused.
+    
+    Args:
+        headless (bool, optional): Run without a browser window.
+            Defaults to False.
+        block_resources (bool, optional): Skip images, fonts and analytics.
+            Defaults to True.
+        profile_dir (str, optional): Chrome profile directory to reuse, or
+            None for a fresh temporary profile. Defaults to _PROFILE_DIR.
     
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver instance
@@ -52,297 +163,469 @@ def init_driver():
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument(f"--disk-cache-size={_DISK_CACHE_SIZE}")
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.page_load_strategy = "eager"
+    if block_resources:
+        # Don't load images at all (2 = block)
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     
     driver = webdriver.Chrome(options=chrome_options)
+    if block_resources:
+        # Block fonts, analytics and any images the preference above misses
+        _block_resources(driver)
+    # Waits are explicit (WebDriverWait); lookups that miss return at once
+    driver.implicitly_wait(0)
+    # A hanging request must not stall the script forever
+    driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT)
+    driver.set_script_timeout(_SCRIPT_TIMEOUT)
     return driver
 
-def inspect_page(driver):
+def load_page(driver, url):
+    """
+    Load a URL, retrying with exponential backoff if the page load times out.
+    
+    After a timeout the pending load is stopped before the next attempt
+    (waiting 1 s, 2 s, ... in between).
+    
+    Args:
+        driver (webdriver.Chrome): The Selenium WebDriver instance
+        url (str): URL to load
+    
+    Raises:
+        TimeoutException: If the last attempt times out as well.
+    """
+    for attempt in range(_PAGE_LOAD_ATTEMPTS):
+        try:
+            driver.get(url)
+            return
+        except TimeoutException:
+            driver.execute_script("window.stop();")
+            if attempt == _PAGE_LOAD_ATTEMPTS - 1:
+                raise
+            log.warning(f"⚠ Page load timed out, retrying ({attempt + 2}/{_PAGE_LOAD_ATTEMPTS})...")
+            time.sleep(2 ** attempt)
+
+def dump_elements(driver, css, fields=(), text=None, limit=None):
+    """
+    Describe the elements matching a CSS selector with one script call.
+    
+    Reading attributes through WebElement.get_attribute() costs a WebDriver
+    round-trip per attribute and element; this collects everything in the
+    browser instead. Only the first ``limit`` elements are described (their
+    text and visibility need layout information); the rest are just counted.
+    
+    Args:
+        driver (webdriver.Chrome): The Selenium WebDriver instance
+        css (str): CSS selector of the elements to describe
+        fields (sequence of str): Attributes to read (e.g. "name", "type")
+        text (str, optional): Only include elements whose own text contains
+            this string. Defaults to None (all matching elements).
+        limit (int, optional): Describe at most this many elements.
+            Defaults to None (all).
+    
+    Returns:
+        tuple: (count, elements) - the number of matching elements and one
+            dict per described element with "tag", the requested fields,
+            "text" (first 50 characters) and "visible".
+    """
+    result = driver.execute_script(_DUMP_ELEMENTS_JS, css, list(fields), text, limit)
+    return result["count"], result["elements"]
+
+def wait_and_extract_listings(driver):
+    """
+    Wait for the search results to render, then extract the listings.
+    
+    Listings are rendered as apartment-* containers (or title buttons) once
+    Livewire has responded to the submitted search. If none appear within
+    15 seconds, extraction is attempted anyway.
+    
+    Args:
+        driver (webdriver.Chrome): The Selenium WebDriver instance
+    
+    Returns:
+        list: Listing dicts as returned by scraper.extract_listings().
+    """
+    try:
+        WebDriverWait(driver, 15).until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "div[id^='apartment-'], button.list__item__title")
+        ))
+    except TimeoutException:
+        log.warning("⚠ No listings rendered yet, extracting anyway")
+    return extract_listings(driver)
+
+def load_seen_urls():
+    """
+    Load the listing URLs the scraper has already stored, for comparison.
+    
+    Returns:
+        set[str]: URLs from config.DATABASE_PATH. Empty if the database does
+            not exist yet or cannot be read (it is never created here).
+    """
+    if not os.path.isfile(config.DATABASE_PATH):
+        return set()
+    try:
+        return get_seen_listing_urls()
+    except sqlite3.Error as e:
+        log.warning(f"⚠ Could not read seen listings: {e}")
+        return set()
+
+def _elements_with_text(soup, text):
     """
-    Inspect and print information about page structure for debugging.
+    Find elements whose own text contains a string in parsed HTML.
     
-    This function examines various elements on the page and prints useful
+    Matches like the XPath //*[contains(text(), ...)]: only text directly
+    inside an element counts, not text of its descendants.
+    
+    Args:
+        soup (BeautifulSoup): Parsed page source
+        text (str): Text to look for
+    
+    Returns:
+        list: Matching elements (bs4 Tags) in document order, without duplicates.
+    """
+    elements = []
+    seen = set()
+    for string in soup.find_all(string=lambda s: text in s):
+        parent = string.parent
+        # Tags compare by content, so deduplicate by identity
+        if parent is not None and id(parent) not in seen:
+            seen.add(id(parent))
+            elements.append(parent)
+    return elements
+
+def inspect_page(driver, force=False, source_path="test_page_source.html"):
+    """
+    Inspect and log information about page structure for debugging.
+    
+    This function examines various elements on the page and logs useful
     information to help debug selector issues. It checks for:
     - Privacy banner elements
     - Search filter buttons
     - Input fields
     - Buttons
     
-    It also saves the full page source HTML to test_page_source.html for
-    manual inspection.
+    It also saves the full page source HTML to source_path for
+    manual inspection. The page source is fetched once and parsed with
+    BeautifulSoup; only visibility checks query the live page.
+    
+    If the URL and page source are unchanged since an earlier call, the
+    page is not inspected again.
     
     Args:
         driver (webdriver.Chrome): The Selenium WebDriver instance
+        force (bool, optional): Inspect even if the page is unchanged.
+            Defaults to False.
+        source_path (str, optional): File to save the page source to.
+            Defaults to "test_page_source.html".
     
     Side Effects:
-        - Prints inspection results to console
-        - Saves page source to test_page_source.html
+        - Logs inspection results (INFO level)
+        - Saves page source to source_path
     """
-    print("\n=== PAGE INSPECTION ===\n")
+    log.info("\n=== PAGE INSPECTION ===\n")
     
     # Print page title
-    print(f"Page Title: {driver.title}")
-    print(f"Current URL: {driver.current_url}\n")
+    log.info(f"Page Title: {driver.title}")
+    current_url = driver.current_url
+    log.info(f"Current URL: {current_url}\n")
+    
+    # Fetch the page source once; the read-only lookups below run against
+    # the parsed snapshot instead of querying the live DOM each time
+    page_source = driver.page_source
+    # Encode in one pass; lone surrogates from the DOM must not abort the dump
+    page_bytes = page_source.encode("utf-8", errors="replace")
+    
+    page_key = (current_url, hashlib.blake2b(page_bytes, digest_size=16).digest())
+    if page_key in _inspected_pages and not force:
+        log.info(f"Page unchanged since the last inspection, see {source_path}")
+        return
+    _inspected_pages.add(page_key)
+    
+    soup = BeautifulSoup(page_source, "html.parser")
     
     # Look for privacy banner
-    print("Looking for privacy banner...")
+    log.info("Looking for privacy banner...")
     try:
-        # Try by ID first
-        try:
-            privacy_by_id = driver.find_element(By.ID, "accept-all-cookies")
-            print(f"  ✓ Found button by ID: {privacy_by_id.tag_name}, Visible: {privacy_by_id.is_displayed()}")
-        except:
-            print("  ✗ Button with id='accept-all-cookies' not found")
+        # Try by ID first (visibility needs the live page)
+        privacy_by_id = soup.find(id="accept-all-cookies")
+        if privacy_by_id is not None:
+            _, live_buttons = dump_elements(driver, "#accept-all-cookies", limit=1)
+            visible = bool(live_buttons) and live_buttons[0]["visible"]
+            log.info(f"  ✓ Found button by ID: {privacy_by_id.name}, Visible: {visible}")
+        else:
+            log.info("  ✗ Button with id='accept-all-cookies' not found")
         
         # Try by wire:click
-        try:
-            privacy_by_wire = driver.find_elements(By.XPATH, "//button[@wire:click='onCookieAll']")
-            print(f"  Found {len(privacy_by_wire)} buttons with wire:click='onCookieAll'")
-        except:
-            print("  No buttons with wire:click found")
+        privacy_by_wire = soup.find_all("button", attrs={"wire:click": "onCookieAll"})
+        log.info(f"  Found {len(privacy_by_wire)} buttons with wire:click='onCookieAll'")
         
-        # Try by text content
-        privacy_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'Alle akzeptieren')]")
-        print(f"Found {len(privacy_elements)} elements with 'Alle akzeptieren' text")
-        for elem in privacy_elements[:5]:  # Show first 5
-            try:
-                print(f"  - Tag: {elem.tag_name}, Text: {elem.text[:50]}, Visible: {elem.is_displayed()}")
-            except:
-                print(f"  - Tag: {elem.tag_name}, Text: {elem.text[:50]}")
+        # Try by text content (visibility shows whether the banner is open)
+        privacy_count, privacy_elements = dump_elements(driver, "*", text="Alle akzeptieren", limit=5)
+        log.info(f"Found {privacy_count} elements with 'Alle akzeptieren' text")
+        for elem in privacy_elements:  # Show first 5
+            log.info(f"  - Tag: {elem['tag']}, Text: {elem['text']}, Visible: {elem['visible']}")
     except Exception as e:
-        print(f"  Error looking for privacy elements: {e}")
+        log.warning(f"  Error looking for privacy elements: {e}")
     
     # Look for Suchfilter button
-    print("\nLooking for 'Suchfilter' button...")
-    try:
-        filter_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'Suchfilter')]")
-        print(f"Found {len(filter_elements)} elements with 'Suchfilter' text")
-        for elem in filter_elements:
-            print(f"  - Tag: {elem.tag_name}, Text: {elem.text[:50]}")
-    except:
-        print("  No Suchfilter elements found")
+    log.info("\nLooking for 'Suchfilter' button...")
+    filter_elements = _elements_with_text(soup, "Suchfilter")
+    log.info(f"Found {len(filter_elements)} elements with 'Suchfilter' text")
+    for elem in filter_elements:
+        log.info(f"  - Tag: {elem.name}, Text: {elem.get_text(' ', strip=True)[:50]}")
     
     # Look for input fields
-    print("\nLooking for input fields...")
-    try:
-        inputs = driver.find_elements(By.TAG_NAME, "input")
-        print(f"Found {len(inputs)} input elements")
-        for inp in inputs[:10]:  # Show first 10
-            placeholder = inp.get_attribute("placeholder") or ""
-            name = inp.get_attribute("name") or ""
-            input_id = inp.get_attribute("id") or ""
-            print(f"  - Type: {inp.get_attribute('type')}, Placeholder: {placeholder[:30]}, Name: {name}, ID: {input_id[:30]}")
-    except:
-        print("  No input elements found")
+    log.info("\nLooking for input fields...")
+    inputs = soup.find_all("input")
+    log.info(f"Found {len(inputs)} input elements")
+    for inp in inputs[:10]:  # Show first 10
+        placeholder = inp.get("placeholder", "")
+        name = inp.get("name", "")
+        input_id = inp.get("id", "")
+        log.info(f"  - Type: {inp.get('type', 'text')}, Placeholder: {placeholder[:30]}, Name: {name}, ID: {input_id[:30]}")
     
     # Look for buttons
-    print("\nLooking for buttons...")
-    try:
-        buttons = driver.find_elements(By.TAG_NAME, "button")
-        print(f"Found {len(buttons)} button elements")
-        for btn in buttons[:10]:  # Show first 10
-            print(f"  - Text: {btn.text[:50]}, Type: {btn.get_attribute('type')}")
-    except:
-        print("  No button elements found")
+    log.info("\nLooking for buttons...")
+    buttons = soup.find_all("button")
+    log.info(f"Found {len(buttons)} button elements")
+    for btn in buttons[:10]:  # Show first 10
+        log.info(f"  - Text: {btn.get_text(' ', strip=True)[:50]}, Type: {btn.get('type', 'submit')}")
     
     # Save page source
-    print("\nSaving page source to test_page_source.html...")
-    with open("test_page_source.html", "w", encoding="utf-8") as f:
-        f.write(driver.page_source)
-    print("✓ Page source saved")
+    log.info(f"\nSaving page source to {source_path}...")
+    with open(source_path, "wb") as f:
+        f.write(page_bytes)
+    log.info("✓ Page source saved")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Debug the scraper against the live website.")
+    parser.add_argument("--headless", action="store_true",
+                        help="run Chrome without a window")
+    parser.add_argument("--load-resources", action="store_true",
+                        help="load images, web fonts and analytics like a normal browser")
+    parser.add_argument("--quiet", action="store_true",
+                        help="only show warnings and errors")
+    parser.add_argument("--fresh-profile", action="store_true",
+                        help="start with an empty browser profile (shows the privacy banner)")
+    parser.add_argument("--interactive", action="store_true",
+                        help="wait for Enter before closing the browser")
+    parser.add_argument("--rent-max", type=int, default=_DEFAULT_RENT_MAX,
+                        help=f"maximum cold rent to search for (default: {_DEFAULT_RENT_MAX})")
+    args = parser.parse_args()
+    
+    # Runs with other rent limits may run in parallel: Chrome locks a profile
+    # while it is in use, and each run needs its own page source file
+    if args.rent_max == _DEFAULT_RENT_MAX:
+        profile_dir, source_path = _PROFILE_DIR, "test_page_source.html"
+    else:
+        profile_dir = f"{_PROFILE_DIR}-{args.rent_max}"
+        source_path = f"test_page_source_{args.rent_max}.html"
+    
+    configure_logging()
+    if args.quiet:
+        # Root level, so the scraper module's INFO output is hidden as well
+        logging.getLogger().setLevel(logging.WARNING)
     driver = None
     try:
-        driver = init_driver()
-        driver.get("https://www.inberlinwohnen.de/wohnungsfinder")
+        driver = init_driver(headless=args.headless, block_resources=not args.load_resources,
+                             profile_dir=None if args.fresh_profile else profile_dir)
+        load_page(driver, "https://www.inberlinwohnen.de/wohnungsfinder")
         
-        print("Waiting for page to load...")
-        time.sleep(5)
+        log.info("Waiting for page to load...")
+        # Either the privacy banner or (if cookies were already accepted)
+        # the search filter button shows that the page is usable
+        try:
+            WebDriverWait(driver, 15).until(EC.any_of(
+                EC.presence_of_element_located((By.ID, "accept-all-cookies")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "button[aria-label='Suchfilter']")),
+            ))
+        except TimeoutException:
+            log.warning("⚠ Page did not finish loading, inspecting anyway")
         
         # Inspect initial page
-        inspect_page(driver)
+        inspect_page(driver, source_path=source_path)
         
         # Try to accept privacy
-        print("\n=== ACCEPTING PRIVACY ===\n")
-        try:
-            # Wait for page to fully load
-            wait = WebDriverWait(driver, 10)
-            time.sleep(2)  # Wait for Livewire to initialize
-            
-            # Try multiple selectors for the privacy button
-            accept_selectors = [
-                (By.ID, "accept-all-cookies"),
-                (By.XPATH, "//button[@id='accept-all-cookies']"),
-                (By.XPATH, "//button[@wire:click='onCookieAll']"),
-                (By.XPATH, "//button[.//span[contains(text(), 'Alle akzeptieren')]]"),
-            ]
-            
-            accept_btn = None
-            for by, selector in accept_selectors:
+        log.info("\n=== ACCEPTING PRIVACY ===\n")
+        # With a reused profile the consent cookie is usually stored already
+        if not driver.find_elements(By.ID, "accept-all-cookies"):
+            log.info("✓ No privacy banner, settings already accepted")
+        else:
+            try:
+                # Wait for Livewire to initialize (components registered)
+                wait = WebDriverWait(driver, 10)
                 try:
-                    accept_btn = wait.until(EC.element_to_be_clickable((by, selector)))
-                    break
-                except:
-                    continue
-            
-            if accept_btn:
+                    WebDriverWait(driver, 15, poll_frequency=0.1).until(
+                        lambda d: d.execute_script(_LIVEWIRE_READY_JS)
+                    )
+                except TimeoutException:
+                    log.warning("⚠ Livewire not initialized yet, continuing anyway")
+                
+                # All known privacy button selectors are checked in one wait, so
+                # a missing banner costs a single timeout instead of one per
+                # selector. Attribute selectors use (native) CSS; only the text
+                # match needs XPath.
+                accept_btn = None
                 try:
-                    accept_btn.click()
-                except:
-                    # Use JavaScript click as fallback for Livewire
-                    driver.execute_script("arguments[0].click();", accept_btn)
-                print("✓ Clicked 'Alle akzeptieren'")
-                time.sleep(3)
-            else:
-                print("⚠ Could not find privacy button")
-        except Exception as e:
-            print(f"⚠ Could not accept privacy: {e}")
-            import traceback
-            traceback.print_exc()
+                    accept_btn = wait.until(EC.any_of(
+                        EC.element_to_be_clickable(
+                            (By.CSS_SELECTOR, "#accept-all-cookies, button[wire\\:click='onCookieAll']")
+                        ),
+                        EC.element_to_be_clickable((By.XPATH, "//button[.//span[contains(text(), 'Alle akzeptieren')]]")),
+                    ))
+                    log.info(f"✓ Found privacy button: id={accept_btn.get_attribute('id')!r}")
+                except TimeoutException:
+                    pass
+                
+                if accept_btn:
+                    try:
+                        accept_btn.click()
+                    except WebDriverException:
+                        # Use JavaScript click as fallback for Livewire
+                        driver.execute_script("arguments[0].click();", accept_btn)
+                    log.info("✓ Clicked 'Alle akzeptieren'")
+                    try:
+                        wait.until(EC.invisibility_of_element_located((By.ID, "accept-all-cookies")))
+                    except TimeoutException:
+                        log.warning("⚠ Privacy banner still visible")
+                else:
+                    log.warning("⚠ Could not find privacy button")
+            except Exception as e:
+                log.exception(f"⚠ Could not accept privacy: {e}")
         
         # Try to open filters
-        print("\n=== OPENING FILTERS ===\n")
+        log.info("\n=== OPENING FILTERS ===\n")
         try:
             wait = WebDriverWait(driver, 10)
-            filter_selectors = [
-                (By.XPATH, "//button[@aria-label='Suchfilter']"),
-                (By.XPATH, "//button[contains(@class, 'button--icon') and .//i[contains(@class, 'fa-search')]]"),
-                (By.XPATH, "//button[.//span[contains(text(), 'Suchfilter')]]"),
-            ]
-            
+            # All known filter button selectors in one wait (CSS where possible)
             filter_btn = None
-            for by, selector in filter_selectors:
-                try:
-                    filter_btn = wait.until(EC.element_to_be_clickable((by, selector)))
-                    break
-                except:
-                    continue
+            try:
+                filter_btn = wait.until(EC.any_of(
+                    EC.element_to_be_clickable(
+                        (By.CSS_SELECTOR, "button[aria-label='Suchfilter'], button.button--icon:has(i.fa-search)")
+                    ),
+                    EC.element_to_be_clickable((By.XPATH, "//button[.//span[contains(text(), 'Suchfilter')]]")),
+                ))
+                log.info(f"✓ Found filter button: aria-label={filter_btn.get_attribute('aria-label')!r}, "
+                      f"class={filter_btn.get_attribute('class')!r}")
+            except TimeoutException:
+                pass
             
             if filter_btn:
                 filter_btn.click()
-                print("✓ Clicked 'Suchfilter'")
-                time.sleep(3)
+                log.info("✓ Clicked 'Suchfilter'")
+                try:
+                    wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Meine Suchkriterien')]")))
+                except TimeoutException:
+                    log.warning("⚠ Search filter modal did not appear")
                 
                 # Inspect page after opening filters
-                inspect_page(driver)
+                inspect_page(driver, source_path=source_path)
                 
                 # Try to set values and submit
-                print("\n=== SETTING VALUES AND SUBMITTING ===\n")
+                log.info("\n=== SETTING VALUES AND SUBMITTING ===\n")
                 try:
                     # Wait for modal
                     wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Meine Suchkriterien')]")))
-                    time.sleep(2)
-                    
-                    # Set Kaltmiete max
-                    try:
-                        kaltmiete_max = wait.until(EC.presence_of_element_located((By.NAME, "searchParams.rentNet.max")))
-                        kaltmiete_max.clear()
-                        kaltmiete_max.send_keys("460")
-                        print("✓ Set Kaltmiete max to 460")
-                    except Exception as e:
-                        print(f"⚠ Could not set Kaltmiete: {e}")
-                    
-                    # Set Zimmer min
-                    try:
-                        zimmer_min = wait.until(EC.presence_of_element_located((By.NAME, "searchParams.rooms.min")))
-                        zimmer_min.clear()
-                        zimmer_min.send_keys("1")
-                        print("✓ Set Zimmer min to 1")
-                    except Exception as e:
-                        print(f"⚠ Could not set Zimmer min: {e}")
-                    
-                    # Set Zimmer max
-                    try:
-                        zimmer_max = wait.until(EC.presence_of_element_located((By.NAME, "searchParams.rooms.max")))
-                        zimmer_max.clear()
-                        zimmer_max.send_keys("2")
-                        print("✓ Set Zimmer max to 2")
-                    except Exception as e:
-                        print(f"⚠ Could not set Zimmer max: {e}")
                     
-                    # Set Wohnfläche max
+                    # Set all fields in one script call; input/change events
+                    # let Livewire pick up the values
+                    fields = [
+                        ("Kaltmiete max", "searchParams.rentNet.max", str(args.rent_max)),
+                        ("Zimmer min", "searchParams.rooms.min", "1"),
+                        ("Zimmer max", "searchParams.rooms.max", "2"),
+                        ("Wohnfläche max", "searchParams.area.max", "50"),
+                    ]
                     try:
-                        wohnflaeche_max = wait.until(EC.presence_of_element_located((By.NAME, "searchParams.area.max")))
-                        wohnflaeche_max.clear()
-                        wohnflaeche_max.send_keys("50")
-                        print("✓ Set Wohnfläche max to 50")
+                        wait.until(EC.presence_of_element_located((By.NAME, fields[0][1])))
+                        missing = driver.execute_script(
+                            _SET_FIELDS_JS, [[name, value] for _, name, value in fields]
+                        )
+                        for label, name, value in fields:
+                            if name in missing:
+                                log.warning(f"⚠ Could not set {label}: field {name} not found")
+                            else:
+                                log.info(f"✓ Set {label} to {value}")
                     except Exception as e:
-                        print(f"⚠ Could not set Wohnfläche: {e}")
+                        log.warning(f"⚠ Could not set search fields: {e}")
                     
                     # Find and click submit button
                     try:
-                        submit_selectors = [
-                            "//button[@type='submit' and contains(., 'Wohnung suchen')]",
-                            "//form//button[@type='submit']",
-                            "//button[contains(., 'Wohnung suchen')]",
-                        ]
-                        
+                        # All known submit button selectors in one wait; EC.any_of
+                        # checks them in this order on each poll, so the
+                        # "Wohnung suchen" button wins over other submit buttons
                         submit_btn = None
-                        for selector in submit_selectors:
-                            try:
-                                submit_btn = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                                print(f"✓ Found submit button: {selector}")
-                                break
-                            except:
-                                continue
+                        try:
+                            submit_btn = wait.until(EC.any_of(
+                                EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and contains(., 'Wohnung suchen')]")),
+                                EC.element_to_be_clickable((By.CSS_SELECTOR, "form button[type='submit']")),
+                                EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Wohnung suchen')]")),
+                            ))
+                            log.info(f"✓ Found submit button: type={submit_btn.get_attribute('type')!r}, "
+                                  f"text={submit_btn.text[:50]!r}")
+                        except TimeoutException:
+                            pass
                         
                         if submit_btn:
                             driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-                            time.sleep(0.5)
                             driver.execute_script("arguments[0].click();", submit_btn)
-                            print("✓ Clicked submit button")
-                            time.sleep(5)
-                            print("✓ Waiting for results...")
+                            log.info("✓ Clicked submit button")
+                            log.info("✓ Waiting for results...")
                             
                             # Now try to extract listings
-                            print("\n=== EXTRACTING LISTINGS ===\n")
+                            log.info("\n=== EXTRACTING LISTINGS ===\n")
                             try:
-                                listings = extract_listings(driver)
+                                listings = wait_and_extract_listings(driver)
+                                seen_urls = load_seen_urls()
                                 if listings:
-                                    print(f"\n✓ Successfully extracted {len(listings)} listings!")
-                                    print("\nFirst few listings:")
+                                    log.info(f"\n✓ Successfully extracted {len(listings)} listings!")
+                                    new_count = sum(1 for listing in listings if listing.get('url') not in seen_urls)
+                                    log.info(f"  {new_count} of them are not in {config.DATABASE_PATH} yet")
+                                    log.info("\nFirst few listings:")
                                     for i, listing in enumerate(listings[:3], 1):
-                                        print(f"\n  Listing {i}:")
-                                        print(f"    URL: {listing.get('url', 'N/A')}")
-                                        print(f"    Title: {listing.get('title', 'N/A')[:60]}")
-                                        print(f"    Address: {listing.get('address', 'N/A')}")
-                                        print(f"    Rooms: {listing.get('rooms', 'N/A')}")
-                                        print(f"    Area: {listing.get('area', 'N/A')} m²")
-                                        print(f"    Price: {listing.get('price', 'N/A')} €")
-                                        print(f"    Nebenkosten: {listing.get('extra_costs', 'N/A')}")
-                                        print(f"    WBS: {listing.get('wbs', 'N/A')}")
-                                        print(f"    Image URL: {listing.get('image_url', 'N/A')}")
+                                        log.info(f"\n  Listing {i}:")
+                                        log.info(f"    URL: {listing.get('url', 'N/A')}")
+                                        log.info(f"    New: {listing.get('url') not in seen_urls}")
+                                        log.info(f"    Title: {listing.get('title', 'N/A')[:60]}")
+                                        log.info(f"    Address: {listing.get('address', 'N/A')}")
+                                        log.info(f"    Rooms: {listing.get('rooms', 'N/A')}")
+                                        log.info(f"    Area: {listing.get('area', 'N/A')} m²")
+                                        log.info(f"    Price: {listing.get('price', 'N/A')} €")
+                                        log.info(f"    Nebenkosten: {listing.get('extra_costs', 'N/A')}")
+                                        log.info(f"    WBS: {listing.get('wbs', 'N/A')}")
+                                        log.info(f"    Image URL: {listing.get('image_url', 'N/A')}")
                                 else:
-                                    print("⚠ No listings extracted")
+                                    log.warning("⚠ No listings extracted")
                             except Exception as e:
-                                print(f"✗ Error extracting listings: {e}")
-                                import traceback
-                                traceback.print_exc()
+                                log.exception(f"✗ Error extracting listings: {e}")
                         else:
-                            print("✗ Could not find submit button")
+                            log.error("✗ Could not find submit button")
                     except Exception as e:
-                        print(f"⚠ Error submitting: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        log.exception(f"⚠ Error submitting: {e}")
                         
                 except Exception as e:
-                    print(f"⚠ Error setting values: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    log.exception(f"⚠ Error setting values: {e}")
             else:
-                print("⚠ Could not find Suchfilter button")
+                log.warning("⚠ Could not find Suchfilter button")
         except Exception as e:
-            print(f"⚠ Could not open filters: {e}")
+            log.warning(f"⚠ Could not open filters: {e}")
         
-        print("\n=== TEST COMPLETE ===")
-        print("Check test_page_source.html for full HTML structure")
-        print("\nPress Enter to close browser...")
-        input()
+        log.info("\n=== TEST COMPLETE ===")
+        log.info(f"Check {source_path} for full HTML structure")
+        if args.interactive:
+            print("\nPress Enter to close browser...")
+            input()
         
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"Error: {e}")
     finally:
         if driver:
             driver.quit()
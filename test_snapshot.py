@@ -0,0 +1,46 @@
+"""
+Unit tests for reading Livewire wire:snapshot attributes.
+
+Run with:
+    >>> python -m unittest test_snapshot
+"""
+import json
+import unittest
+
+from scraper import _parse_snapshot, _snapshot_deeplink
+
+DEEPLINK = "https://www.example.com/expose?id=1&region=berlin&notify=1&para=2"
+
+SNAPSHOT = json.dumps({
+    "data": {
+        "item": [{
+            "deeplink": DEEPLINK,
+            "imageUrl": "https://www.example.com/img.jpg?w=1&copy=1",
+            "details": [[{"label": "WBS", "value": "nicht erforderlich"}], {"s": "arr"}],
+        }, {"s": "arr"}],
+    },
+})
+"""Snapshot as the DOM returns it: plain JSON, entities already decoded."""
+
+
+class ParseSnapshotTest(unittest.TestCase):
+    def test_keeps_ampersand_sequences(self):
+        found = _parse_snapshot(SNAPSHOT)
+        self.assertEqual(found["deeplink"], DEEPLINK)
+        self.assertEqual(found["imageUrl"], "https://www.example.com/img.jpg?w=1&copy=1")
+
+    def test_reads_wbs_detail(self):
+        self.assertEqual(_parse_snapshot(SNAPSHOT)["wbs"], "nicht erforderlich")
+
+
+class SnapshotDeeplinkTest(unittest.TestCase):
+    def test_keeps_ampersand_sequences(self):
+        self.assertEqual(_snapshot_deeplink(SNAPSHOT), DEEPLINK)
+
+    def test_missing_snapshot(self):
+        self.assertIsNone(_snapshot_deeplink(None))
+        self.assertIsNone(_snapshot_deeplink('{"data": {}}'))
+
+
+if __name__ == "__main__":
+    unittest.main()